@@ -9,51 +9,83 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-from collections import Counter
+import contextlib
+import sys
+import time
+from collections.abc import Mapping
 from dataclasses import dataclass
-from datetime import datetime
+from enum import StrEnum
 
 from bleak import BleakScanner
 
 from opendisplay import (
     MANUFACTURER_ID,
     AdvertisementData,
+    AdvertisementFormat,
     AdvertisementTracker,
+    ButtonEventType,
     parse_advertisement,
 )
 
+# Advertisements buffered between the scanner callback and the consumer task
+QUEUE_SIZE = 1024
+# Output lines held before forcing a write during a burst of packets
+FLUSH_LINES = 50
 
-@dataclass
+_out_buf: list[str] = []
+
+
+@dataclass(slots=True)
 class SeenDevice:
-    """Track per-device payload changes."""
+    """Track per-device payload changes.
+
+    Payloads are compared by an integer fingerprint plus length so duplicate
+    packets never need a fresh ``bytes`` copy.
+    """
 
-    last_payload: bytes = b""
+    last_fingerprint: int = -1
+    last_len: int = 0
     packets_seen: int = 0
     packets_printed: int = 0
 
 
 def _timestamp() -> str:
-    return datetime.now().strftime("%H:%M:%S")
+    now = time.localtime()
+    return f"{now.tm_hour:02d}:{now.tm_min:02d}:{now.tm_sec:02d}"
+
+
+def _emit(line: str) -> None:
+    """Queue one output line, writing out once a full batch is pending."""
+    _out_buf.append(line)
+    if len(_out_buf) >= FLUSH_LINES:
+        _flush()
+
+
+def _flush() -> None:
+    """Write all pending output lines with a single stdout write."""
+    if _out_buf:
+        sys.stdout.write("\n".join(_out_buf) + "\n")
+        sys.stdout.flush()
+        _out_buf.clear()
 
 
 def _print_packet(address: str, name: str, rssi: int | None, payload: bytes, parsed: AdvertisementData) -> None:
     """Print one parsed advertisement packet."""
-    base = (
-        f"[{_timestamp()}] {name} ({address}) rssi={rssi} "
-        f"format={parsed.format_version} battery={parsed.battery_mv}mV "
-        f"temp={parsed.temperature_c:.1f}C loop={parsed.loop_counter} "
-        f"len={len(payload)}"
-    )
-
-    if parsed.format_version == "v1":
-        print(
-            base
-            + f" reboot={parsed.reboot_flag} "
-            + f"conn_req={parsed.connection_requested} "
-            + f"dyn={parsed.dynamic_data.hex()}"
+    if parsed.format_version == AdvertisementFormat.V1:
+        _emit(
+            f"[{_timestamp()}] {name} ({address}) rssi={rssi} "
+            f"format={parsed.format_version} battery={parsed.battery_mv}mV "
+            f"temp={parsed.temperature_c:.1f}C loop={parsed.loop_counter} "
+            f"len={len(payload)} reboot={parsed.reboot_flag} "
+            f"conn_req={parsed.connection_requested} dyn={parsed.dynamic_hex}"
         )
     else:
-        print(base)
+        _emit(
+            f"[{_timestamp()}] {name} ({address}) rssi={rssi} "
+            f"format={parsed.format_version} battery={parsed.battery_mv}mV "
+            f"temp={parsed.temperature_c:.1f}C loop={parsed.loop_counter} "
+            f"len={len(payload)}"
+        )
 
 
 def _print_event(
@@ -67,58 +99,82 @@ def _print_event(
 ) -> None:
     """Print one tracker event."""
     state = "down" if pressed else "up"
-    print(
+    _emit(
         f"[{_timestamp()}] EVENT {name} ({address}) type={event_type} "
         f"byte={byte_index} button_id={button_id} state={state} count={count}"
     )
 
 
+def _nonzero_counts(counts: Mapping[StrEnum, int]) -> dict[str, int]:
+    """Render enum-keyed counters by value, leaving out zero entries."""
+    return {key.value: count for key, count in counts.items() if count}
+
+
 async def listen(duration: float, print_all: bool) -> None:
     """Listen for advertisements and print parsed payloads."""
     seen: dict[str, SeenDevice] = {}
-    formats_seen: Counter[str] = Counter()
-    event_counts: Counter[str] = Counter()
+    # Fixed key sets: increments are plain dict stores, no Counter.__missing__
+    formats_seen = dict.fromkeys(AdvertisementFormat, 0)
+    event_counts = dict.fromkeys(ButtonEventType, 0)
     tracker = AdvertisementTracker()
 
+    queue: asyncio.Queue[tuple[str, str | None, int | None, bytes]] = asyncio.Queue(maxsize=QUEUE_SIZE)
+    dropped = 0
+
     def callback(device, advertisement_data) -> None:
+        """Hand packets to the consumer so the scanner callback never blocks."""
+        nonlocal dropped
         payload = advertisement_data.manufacturer_data.get(MANUFACTURER_ID)
         if payload is None:
             return
-
-        entry = seen.setdefault(device.address, SeenDevice())
+        try:
+            queue.put_nowait((device.address, device.name, advertisement_data.rssi, payload))
+        except asyncio.QueueFull:
+            dropped += 1
+
+    def handle(address: str, device_name: str | None, rssi: int | None, payload: bytes) -> None:
+        """Diff, parse, print, and track one queued advertisement."""
+        entry = seen.get(address)
+        if entry is None:
+            entry = SeenDevice()
+            seen[address] = entry
         entry.packets_seen += 1
 
-        payload_bytes = bytes(payload)
-        changed = payload_bytes != entry.last_payload
+        fingerprint = int.from_bytes(payload, "little")
+        changed = fingerprint != entry.last_fingerprint or len(payload) != entry.last_len
         if not print_all and not changed:
             return
 
-        entry.last_payload = payload_bytes
+        entry.last_fingerprint = fingerprint
+        entry.last_len = len(payload)
         entry.packets_printed += 1
 
-        name = device.name or "Unknown"
+        # Bleak already hands out bytes; only copy other buffer types
+        payload_bytes = payload if isinstance(payload, bytes) else bytes(payload)
+
+        name = device_name or "Unknown"
         try:
-            parsed = parse_advertisement(payload_bytes)
+            parsed = parse_advertisement(payload_bytes, shared=True)
         except ValueError as err:
-            print(
-                f"[{_timestamp()}] {name} ({device.address}) rssi={advertisement_data.rssi} "
+            _emit(
+                f"[{_timestamp()}] {name} ({address}) rssi={rssi} "
                 f"len={len(payload_bytes)} parse_error={err} raw={payload_bytes.hex()}"
             )
             return
 
         formats_seen[parsed.format_version] += 1
         _print_packet(
-            address=device.address,
+            address=address,
             name=name,
-            rssi=advertisement_data.rssi,
+            rssi=rssi,
             payload=payload_bytes,
             parsed=parsed,
         )
 
-        for event in tracker.update(device.address, parsed):
+        for event in tracker.update(address, parsed):
             event_counts[event.event_type] += 1
             _print_event(
-                address=device.address,
+                address=address,
                 name=name,
                 event_type=event.event_type,
                 byte_index=event.byte_index,
@@ -127,6 +183,13 @@ async def listen(duration: float, print_all: bool) -> None:
                 count=event.press_count,
             )
 
+    async def consumer() -> None:
+        while True:
+            handle(*await queue.get())
+            # Write out once the current burst is handled; lines batch up under load
+            if queue.empty():
+                _flush()
+
     print(f"Listening for OpenDisplay advertisements (manufacturer 0x{MANUFACTURER_ID:04x})...")
     if duration > 0:
         print(f"Duration: {duration:.1f}s")
@@ -134,21 +197,39 @@ async def listen(duration: float, print_all: bool) -> None:
         print("Duration: unlimited (Ctrl+C to stop)")
     print("Mode: printing all packets" if print_all else "Mode: printing only changed payloads")
 
+    consumer_task = asyncio.create_task(consumer())
+
+    def check_consumer() -> None:
+        """Re-raise a consumer crash instead of counting later packets as dropped."""
+        if consumer_task.done() and not consumer_task.cancelled():
+            err = consumer_task.exception()
+            if err is not None:
+                raise err
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + duration if duration > 0 else None
     scanner = BleakScanner(detection_callback=callback)
     await scanner.start()
     try:
-        if duration > 0:
-            await asyncio.sleep(duration)
-        else:
-            while True:
-                await asyncio.sleep(1)
+        while deadline is None or (remaining := deadline - loop.time()) > 0:
+            await asyncio.sleep(1 if deadline is None else min(1, remaining))
+            check_consumer()
     finally:
         await scanner.stop()
+        consumer_task.cancel()
+        # Re-raises a consumer crash; a plain cancel is expected here
+        with contextlib.suppress(asyncio.CancelledError):
+            await consumer_task
+        # Process whatever the scanner queued before it stopped
+        while not queue.empty():
+            handle(*queue.get_nowait())
+        _flush()
 
     print("\nSummary:")
     print(f"  devices_seen={len(seen)}")
-    print(f"  formats_seen={dict(formats_seen)}")
-    print(f"  events_seen={dict(event_counts)}")
+    print(f"  packets_dropped={dropped}")
+    print(f"  formats_seen={_nonzero_counts(formats_seen)}")
+    print(f"  events_seen={_nonzero_counts(event_counts)}")
     for address, entry in sorted(seen.items()):
         print(f"  {address}: packets_seen={entry.packets_seen}, packets_printed={entry.packets_printed}")
 
@@ -6,8 +6,8 @@ Pure Python package for communicating with OpenDisplay BLE e-paper tags.
 from epaper_dithering import ColorScheme, DitherMode
 
 from .battery import voltage_to_percent
-from .device import OpenDisplayDevice, prepare_image
-from .discovery import discover_devices
+from .device import OpenDisplayDevice
+from .discovery import discover_devices, find_device_by_name
 from .exceptions import (
     BLEConnectionError,
     BLETimeoutError,
@@ -39,8 +39,10 @@ from .models.config import (
     WifiConfig,
 )
 from .models.enums import (
+    AdvertisementFormat,
     BoardManufacturer,
     BusType,
+    ButtonEventType,
     DIYBoardType,
     FitMode,
     ICType,
@@ -53,6 +55,8 @@ from .models.enums import (
     get_manufacturer_name,
 )
 from .models.led_flash import LedFlashConfig, LedFlashStep
+from .multi_upload import upload_to_many
+from .preparation import prepare_image
 from .protocol import MANUFACTURER_ID, SERVICE_UUID
 
 __version__ = "0.1.0"
@@ -61,7 +65,9 @@ __all__ = [
     # Main API
     "OpenDisplayDevice",
     "discover_devices",
+    "find_device_by_name",
     "prepare_image",
+    "upload_to_many",
     # Exceptions
     "OpenDisplayError",
     "BLEConnectionError",
@@ -90,6 +96,7 @@ __all__ = [
     "ButtonEventData",
     "ButtonChangeEvent",
     # Enums
+    "AdvertisementFormat",
     "ColorScheme",
     "DitherMode",
     "FitMode",
@@ -99,6 +106,7 @@ __all__ = [
     "ICType",
     "PowerMode",
     "BusType",
+    "ButtonEventType",
     "Rotation",
     "SeeedBoardType",
     "WaveshareBoardType",
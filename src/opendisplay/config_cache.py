@@ -0,0 +1,87 @@
+"""On-disk cache of interrogated device configs."""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+from typing import TYPE_CHECKING
+
+from .exceptions import ProtocolError
+from .protocol import parse_config_response
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from .models.config import GlobalConfig
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ConfigCache:
+    """Cached config for one device, stored with the firmware SHA it was read under.
+
+    The raw READ_CONFIG TLV is stored rather than config_to_json() output so the
+    cached config parses back exactly, reserved bytes included. Cache problems
+    are logged and never raised: the worst case is a full interrogation.
+
+    Attributes:
+        path: Cache file, named after the device's MAC address
+    """
+
+    def __init__(self, cache_dir: Path, mac_address: str):
+        """Initialize the cache for one device.
+
+        Args:
+            cache_dir: Directory holding per-device cache files
+            mac_address: Device MAC address
+        """
+        self.mac_address = mac_address
+        self.path = cache_dir / f"{mac_address.replace(':', '').upper()}.json"
+
+    def load(self) -> tuple[str, GlobalConfig] | None:
+        """Read the cached config and the firmware SHA it was stored with.
+
+        Returns:
+            Tuple of (fw_sha, config), or None if missing or unreadable.
+            Corrupt entries are deleted so the next connect re-interrogates.
+        """
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            return str(data["fw_sha"]), parse_config_response(bytes.fromhex(data["tlv"]))
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            _LOGGER.warning("Ignoring unreadable config cache %s: %s", self.path, e)
+            return None
+        except (KeyError, TypeError, ValueError, ProtocolError) as e:
+            _LOGGER.warning("Discarding corrupt config cache %s: %s", self.path, e)
+            with contextlib.suppress(OSError):
+                self.path.unlink(missing_ok=True)
+            return None
+
+    def store(self, fw_sha: str, tlv_data: bytes | bytearray) -> None:
+        """Save raw READ_CONFIG TLV data with the firmware SHA it was read under.
+
+        Args:
+            fw_sha: Firmware SHA reported by the device
+            tlv_data: Raw config TLV data
+        """
+        data = {"mac_address": self.mac_address, "fw_sha": fw_sha, "tlv": tlv_data.hex()}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+        except OSError as e:
+            _LOGGER.warning("Could not write config cache %s: %s", self.path, e)
+            return
+
+        _LOGGER.debug("Cached config for %s in %s", self.mac_address, self.path)
+
+    def invalidate(self) -> None:
+        """Drop the cached config, e.g. after writing a new one."""
+        try:
+            self.path.unlink(missing_ok=True)
+        except OSError as e:
+            _LOGGER.warning("Could not remove config cache %s: %s", self.path, e)
@@ -2,33 +2,32 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
+import struct
+from collections import OrderedDict
+from pathlib import Path
 from typing import TYPE_CHECKING
 
-from epaper_dithering import ColorScheme, DitherMode, dither_image
+from epaper_dithering import ColorPalette, ColorScheme, DitherMode
 from PIL import Image
 
-from .display_palettes import PANELS_4GRAY, get_palette_for_display
-from .encoding import (
-    compress_image_data,
-    encode_bitplanes,
-    encode_image,
-    fit_image,
-)
-from .exceptions import BLETimeoutError, ProtocolError
+from .config_cache import ConfigCache
+from .discovery import find_device_by_name
+from .exceptions import BLEConnectionError, ProtocolError
 from .models.capabilities import DeviceCapabilities
 from .models.config import GlobalConfig
+from .models.config_json import config_from_json, config_to_json
 from .models.enums import BoardManufacturer, FitMode, RefreshMode, Rotation
 from .models.firmware import FirmwareVersion
 from .models.led_flash import LedFlashConfig
+from .preparation import image_fingerprint, prepare_image, resolve_palette, rotate_source_image
 from .protocol import (
     CHUNK_SIZE,
     MAX_COMPRESSED_SIZE,
+    PIPELINE_CHUNKS,
     CommandCode,
-    build_direct_write_data_command,
-    build_direct_write_end_command,
-    build_direct_write_start_compressed,
-    build_direct_write_start_uncompressed,
     build_led_activate_command,
     build_read_config_command,
     build_read_fw_version_command,
@@ -39,123 +38,18 @@ from .protocol import (
     serialize_config,
     validate_ack_response,
 )
-from .protocol.responses import check_response_type, strip_command_echo, unpack_command_code
-from .transport import BLEConnection
+from .protocol.responses import strip_command_echo, unpack_command_code
+from .transport import BLEConnection, DirectWriteTransfer
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from bleak.backends.device import BLEDevice
 
 _LOGGER = logging.getLogger(__name__)
 
-
-def _rotate_source_image(image: Image.Image, rotate: Rotation) -> Image.Image:
-    """Rotate source image by enum value before fitting.
-
-    Rotation uses clockwise semantics for API ergonomics.
-    """
-    if not isinstance(rotate, Rotation):
-        raise TypeError(f"rotate must be Rotation, got {type(rotate).__name__}")
-
-    if rotate == Rotation.ROTATE_0:
-        return image
-    if rotate == Rotation.ROTATE_90:
-        return image.transpose(Image.Transpose.ROTATE_270)
-    if rotate == Rotation.ROTATE_180:
-        return image.transpose(Image.Transpose.ROTATE_180)
-    if rotate == Rotation.ROTATE_270:
-        return image.transpose(Image.Transpose.ROTATE_90)
-    return image
-
-
-def prepare_image(
-    image: Image.Image,
-    config: GlobalConfig | None = None,
-    capabilities: DeviceCapabilities | None = None,
-    use_measured_palettes: bool = True,
-    panel_ic_type: int | None = None,
-    dither_mode: DitherMode = DitherMode.BURKES,
-    compress: bool = True,
-    tone_compression: float | str = "auto",
-    fit: FitMode = FitMode.CONTAIN,
-    rotate: Rotation = Rotation.ROTATE_0,
-) -> tuple[bytes, bytes | None, Image.Image]:
-    """Prepare image for display without requiring a BLE connection.
-
-    Standalone function that processes an image (rotate, fit, dither, encode)
-    using only the device configuration. No device instance or BLE connection
-    needed.
-
-    Args:
-        image: PIL Image to prepare
-        config: Device configuration (GlobalConfig from interrogation)
-        capabilities: Optional explicit capabilities. If None, extracted
-            from config.
-        use_measured_palettes: Use measured color palettes when available
-        panel_ic_type: Panel IC type for palette lookup. If None, extracted
-            from config.
-        dither_mode: Dithering algorithm to use (default: BURKES)
-        compress: Whether to compress the image data (default: True)
-        tone_compression: Dynamic range compression ("auto", or 0.0-1.0)
-        fit: How to map the image to display dimensions (default: CONTAIN)
-        rotate: Source image rotation enum (0/90/180/270)
-
-    Returns:
-        Tuple of (uncompressed_data, compressed_data or None, processed_image)
-
-    Raises:
-        RuntimeError: If config has no display information
-    """
-    if capabilities is None:
-        if config is None or not config.displays:
-            raise RuntimeError("Config has no display information")
-        display = config.displays[0]
-        capabilities = DeviceCapabilities(
-            width=display.pixel_width,
-            height=display.pixel_height,
-            color_scheme=ColorScheme.from_value(display.color_scheme),
-            rotation=display.rotation,
-        )
-
-    if panel_ic_type is None and config is not None and config.displays:
-        panel_ic_type = config.displays[0].panel_ic_type
-
-    target_size = (capabilities.width, capabilities.height)
-    image = _rotate_source_image(image, rotate)
-
-    if image.size != target_size:
-        _LOGGER.info(
-            "Fitting image %dx%d -> %dx%d (mode: %s)",
-            image.width,
-            image.height,
-            capabilities.width,
-            capabilities.height,
-            fit.name,
-        )
-        image = fit_image(image, target_size, fit)
-
-    color_scheme = capabilities.color_scheme
-    if color_scheme == ColorScheme.GRAYSCALE_4 and panel_ic_type is not None and panel_ic_type not in PANELS_4GRAY:
-        _LOGGER.warning(
-            "Panel IC 0x%04x is not a known 4-gray panel. GRAYSCALE_4 encoding may not display correctly.",
-            panel_ic_type,
-        )
-
-    palette = get_palette_for_display(panel_ic_type, color_scheme, use_measured_palettes)
-    dithered = dither_image(image, palette, mode=dither_mode, tone_compression=tone_compression)
-
-    # Encode to device format
-    if color_scheme in (ColorScheme.BWR, ColorScheme.BWY):
-        plane1, plane2 = encode_bitplanes(dithered, color_scheme)
-        image_data = plane1 + plane2
-    else:
-        image_data = encode_image(dithered, color_scheme)
-
-    # Optionally compress
-    compressed_data = None
-    if compress:
-        compressed_data = compress_image_data(image_data, level=6)
-
-    return image_data, compressed_data, dithered
+# Little-endian u16 reader for chunk headers, unpacked in place without slicing
+_unpack_u16_le = struct.Struct("<H").unpack_from
 
 
 class OpenDisplayDevice:
@@ -180,6 +74,10 @@ class OpenDisplayDevice:
         # Use theoretical ColorScheme instead of measured palettes
         async with OpenDisplayDevice(mac, use_measured_palettes=False) as device:
             await device.upload_image(image)
+
+        # Reuse the interrogated config on later connects
+        async with OpenDisplayDevice(mac, cache_dir="~/.cache/opendisplay") as device:
+            await device.upload_image(image)
     """
 
     # BLE operation timeouts (seconds)
@@ -188,6 +86,16 @@ class OpenDisplayDevice:
     TIMEOUT_ACK = 5.0  # Command acknowledgments
     TIMEOUT_REFRESH = 90.0  # Display refresh (firmware spec: up to 60s)
 
+    # DATA chunks written before waiting for the oldest ACK (1 = stop-and-wait)
+    PIPELINE_CHUNKS = PIPELINE_CHUNKS
+
+    # Image bytes per DATA chunk; lower it for links with a small ATT MTU
+    # (firmware accepts at most protocol.CHUNK_SIZE)
+    CHUNK_SIZE = CHUNK_SIZE
+
+    # Recently prepared uploads kept for re-sending unchanged frames (0 disables)
+    PREPARED_CACHE_SIZE = 4
+
     def __init__(
         self,
         mac_address: str | None = None,
@@ -200,6 +108,8 @@ class OpenDisplayDevice:
         max_attempts: int = 4,
         use_services_cache: bool = True,
         use_measured_palettes: bool = True,
+        auto_read_firmware: bool = False,
+        cache_dir: str | Path | None = None,
     ):
         """Initialize OpenDisplay device.
 
@@ -214,6 +124,12 @@ class OpenDisplayDevice:
             max_attempts: Maximum connection attempts for bleak-retry-connector (default: 4)
             use_services_cache: Enable GATT service caching for faster reconnections (default: True)
             use_measured_palettes: Use measured color palettes when available (default: True)
+            auto_read_firmware: Read the firmware version on connect, pipelined with
+                auto-interrogation when that runs too (default: False)
+            cache_dir: Directory for per-device config caches. Interrogated
+                configs are stored there with the firmware SHA, and later
+                connects reuse them after a single firmware version check
+                (default: None, no caching)
 
         Raises:
             ValueError: If neither or both mac_address and device_name provided
@@ -240,6 +156,8 @@ class OpenDisplayDevice:
         self._max_attempts = max_attempts
         self._use_services_cache = use_services_cache
         self._use_measured_palettes = use_measured_palettes
+        self._auto_read_firmware = auto_read_firmware
+        self._cache_dir = Path(cache_dir).expanduser() if cache_dir is not None else None
 
         # Will be set after resolution
         self.mac_address = mac_address or ""  # Resolved in __aenter__
@@ -248,6 +166,12 @@ class OpenDisplayDevice:
         self._config = config
         self._capabilities = capabilities
         self._fw_version: FirmwareVersion | None = None
+        # Firmware gate for activate_led, decided once per firmware version read
+        self._supports_led_activate: bool | None = None
+        # Dither palette, resolved on first upload and reset when config is re-read
+        self._palette: ColorScheme | ColorPalette | None = None
+        # prepare_image() results keyed by image digest and upload options
+        self._prepared_cache: OrderedDict[tuple[object, ...], tuple[bytes, bytes | None, Image.Image]] = OrderedDict()
 
     async def __aenter__(self) -> OpenDisplayDevice:
         """Connect and optionally interrogate device."""
@@ -256,18 +180,19 @@ class OpenDisplayDevice:
         if self._device_name:
             _LOGGER.debug("Resolving device name '%s' to MAC address", self._device_name)
 
-            from .discovery import discover_devices
-            from .exceptions import BLEConnectionError
-
-            devices = await discover_devices(timeout=self._discovery_timeout)
+            # Stops scanning as soon as the device is seen; concurrent connects
+            # share one scan and reuse each other's sightings
+            found = await find_device_by_name(self._device_name, timeout=self._discovery_timeout, shared=True)
 
-            if self._device_name not in devices:
+            if found is None:
                 raise BLEConnectionError(
-                    f"Device '{self._device_name}' not found during discovery. "
-                    f"Available devices: {list(devices.keys())}"
+                    f"Device '{self._device_name}' not found during discovery ({self._discovery_timeout}s scan)"
                 )
 
-            self.mac_address = devices[self._device_name]
+            self.mac_address = found.address
+            # Hand the scanned device to the connection so it does not scan again
+            if self._ble_device is None:
+                self._ble_device = found
             _LOGGER.info(
                 "Resolved device name '%s' to MAC address %s",
                 self._device_name,
@@ -287,11 +212,7 @@ class OpenDisplayDevice:
         )
 
         await self._conn.connect()
-
-        # Auto-interrogate if no config or capabilities provided
-        if self._config is None and self._capabilities is None:
-            _LOGGER.info("No config provided, auto-interrogating device")
-            await self.interrogate()
+        await self._read_on_connect()
 
         # Extract capabilities from config if available
         if self._config and not self._capabilities:
@@ -299,6 +220,60 @@ class OpenDisplayDevice:
 
         return self
 
+    async def _read_on_connect(self) -> None:
+        """Run the reads requested for connect time.
+
+        Auto-interrogates if no config or capabilities were provided, and reads
+        the firmware version if auto_read_firmware is set. When both are needed,
+        the two commands are written back-to-back before reading any response.
+        Firmware answers commands in order on the single notification queue, so
+        the version response arrives before the first config chunk and one
+        round trip is saved.
+
+        With a cache_dir, a cached config is used when the firmware still
+        reports the SHA it was stored with, so reconnecting costs one firmware
+        version read instead of the full chunked config read.
+        """
+        needs_config = self._config is None and self._capabilities is None
+        cache = self._config_cache() if needs_config else None
+
+        if cache is not None:
+            cached = cache.load()
+            if cached is not None:
+                fw_sha, config = cached
+                if (await self.read_firmware_version())["sha"] == fw_sha:
+                    _LOGGER.info("Using cached config from %s", cache.path)
+                    self._config = config
+                else:
+                    _LOGGER.info("Firmware changed since config was cached, re-interrogating")
+                    await self.interrogate()
+                return
+
+            if not self._auto_read_firmware:
+                # A new cache entry needs the firmware SHA to be validated against
+                # later; read it first, without pipelining it with the config read
+                await self.read_firmware_version()
+                await self.interrogate()
+                return
+
+        if needs_config and self._auto_read_firmware:
+            _LOGGER.info("No config provided, auto-interrogating device and reading firmware version")
+            await self._conn.write_command(build_read_fw_version_command())
+            await self._conn.write_command(build_read_config_command())
+            await self._receive_firmware_version()
+            await self._receive_config()
+        elif needs_config:
+            _LOGGER.info("No config provided, auto-interrogating device")
+            await self.interrogate()
+        elif self._auto_read_firmware:
+            await self.read_firmware_version()
+
+    def _config_cache(self) -> ConfigCache | None:
+        """Return this device's config cache, or None without a cache_dir."""
+        if self._cache_dir is None:
+            return None
+        return ConfigCache(self._cache_dir, self.mac_address)
+
     async def __aexit__(
         self,
         exc_type: type[BaseException] | None,
@@ -375,6 +350,22 @@ class OpenDisplayDevice:
         """Get display rotation in degrees."""
         return self._ensure_capabilities().rotation
 
+    @property
+    def display_key(self) -> tuple[int, int, ColorScheme, int | None, bool]:
+        """Get a key for everything that shapes this device's prepared image data.
+
+        Devices with equal keys (size, color scheme, panel IC and palette
+        choice) turn the same image into the same upload data.
+        """
+        capabilities = self._ensure_capabilities()
+        return (
+            capabilities.width,
+            capabilities.height,
+            capabilities.color_scheme,
+            self._panel_ic_type(),
+            self._use_measured_palettes,
+        )
+
     def get_board_manufacturer(self) -> BoardManufacturer | int:
         """Get board manufacturer from config.
 
@@ -428,35 +419,57 @@ class OpenDisplayDevice:
         cmd = build_read_config_command()
         await self._conn.write_command(cmd)
 
+        return await self._receive_config()
+
+    async def _receive_config(self) -> GlobalConfig:
+        """Read and parse the chunked response to a READ_CONFIG command.
+
+        Returns:
+            GlobalConfig with complete device configuration
+
+        Raises:
+            ProtocolError: If interrogation fails
+        """
         # Read first chunk
         response = await self._conn.read_response(timeout=self.TIMEOUT_FIRST_CHUNK)
         chunk_data = strip_command_echo(response, CommandCode.READ_CONFIG)
 
-        # Parse first chunk header
-        total_length = int.from_bytes(chunk_data[2:4], "little")
-        tlv_data = bytearray(chunk_data[4:])
+        # Parse first chunk header and preallocate the full TLV buffer
+        (total_length,) = _unpack_u16_le(chunk_data, 2)
+        first_payload = memoryview(chunk_data)[4:]
+        tlv_data = bytearray(total_length)
+        tlv_data[: len(first_payload)] = first_payload
+        received = len(first_payload)
 
         _LOGGER.debug("First chunk: %d bytes, total length: %d", len(chunk_data), total_length)
 
         # Read remaining chunks
-        while len(tlv_data) < total_length:
+        while received < total_length:
             next_response = await self._conn.read_response(timeout=self.TIMEOUT_CHUNK)
             next_chunk_data = strip_command_echo(next_response, CommandCode.READ_CONFIG)
 
-            # Skip chunk number field (2 bytes) and append data
-            tlv_data.extend(next_chunk_data[2:])
+            # Skip chunk number field (2 bytes) and write data at current offset,
+            # viewing the payload in place rather than slicing out a copy
+            payload = memoryview(next_chunk_data)[2:]
+            tlv_data[received : received + len(payload)] = payload
+            received += len(payload)
 
             _LOGGER.debug(
                 "Received chunk, total: %d/%d bytes",
-                len(tlv_data),
+                received,
                 total_length,
             )
 
-        _LOGGER.info("Received complete TLV data: %d bytes", len(tlv_data))
+        _LOGGER.info("Received complete TLV data: %d bytes", received)
 
-        # Parse complete config response (handles wrapper strip)
-        self._config = parse_config_response(bytes(tlv_data))
+        # Parse complete config response (handles wrapper strip, copies packets once)
+        self._config = parse_config_response(tlv_data)
         self._capabilities = self._extract_capabilities_from_config()
+        self._palette = None
+        self._prepared_cache.clear()
+        # Without the firmware SHA a cache entry could not be validated later
+        if (cache := self._config_cache()) is not None and self._fw_version is not None:
+            cache.store(self._fw_version["sha"], tlv_data)
 
         _LOGGER.info(
             "Interrogated device: %dx%d, %s, rotation=%d°",
@@ -480,11 +493,20 @@ class OpenDisplayDevice:
         cmd = build_read_fw_version_command()
         await self._conn.write_command(cmd)
 
+        return await self._receive_firmware_version()
+
+    async def _receive_firmware_version(self) -> FirmwareVersion:
+        """Read and parse the response to a READ_FW_VERSION command.
+
+        Returns:
+            FirmwareVersion dictionary with 'major', 'minor', and 'sha' fields
+        """
         # Read response
         response = await self._conn.read_response(timeout=self.TIMEOUT_ACK)
 
         # Parse version (includes SHA hash)
         self._fw_version = parse_firmware_version(response)
+        self._supports_led_activate = None
 
         _LOGGER.info(
             "Firmware version: %d.%d (SHA: %s...)",
@@ -548,11 +570,14 @@ class OpenDisplayDevice:
         if self._connection is None:
             raise RuntimeError("Device not connected")
 
-        fw = self._fw_version
-        if fw is None:
-            fw = await self.read_firmware_version()
-        if (fw["major"], fw["minor"]) < (1, 0):
-            raise ProtocolError(f"LED activate requires firmware >= 1.0, got {fw['major']}.{fw['minor']}")
+        supported = self._supports_led_activate
+        if supported is None:
+            fw = self._fw_version or await self.read_firmware_version()
+            supported = self._supports_led_activate = (fw["major"], fw["minor"]) >= (1, 0)
+        if not supported:
+            current = self._fw_version
+            version = f"{current['major']}.{current['minor']}" if current else "unknown"
+            raise ProtocolError(f"LED activate requires firmware >= 1.0, got {version}")
 
         cmd = build_led_activate_command(
             led_instance=led_instance,
@@ -638,15 +663,29 @@ class OpenDisplayDevice:
         response = await self._conn.read_response(timeout=self.TIMEOUT_ACK)
         validate_ack_response(response, CommandCode.WRITE_CONFIG)
 
-        # Send remaining chunks if needed
+        # Send remaining chunks if needed, with the same PIPELINE_CHUNKS window as DATA
+        pipeline_depth = max(1, self.PIPELINE_CHUNKS)
+        in_flight = 0
         for i, chunk_cmd in enumerate(chunk_cmds, start=1):
             _LOGGER.debug("Sending config chunk %d/%d (%d bytes)", i, len(chunk_cmds), len(chunk_cmd))
             await self._conn.write_command(chunk_cmd)
+            in_flight += 1
+
+            # Wait for the oldest ACK once the window is full
+            if in_flight >= pipeline_depth:
+                response = await self._conn.read_response(timeout=self.TIMEOUT_ACK)
+                validate_ack_response(response, CommandCode.WRITE_CONFIG_CHUNK)
+                in_flight -= 1
 
-            # Wait for ACK after each chunk
+        # Drain ACKs for chunks still in flight
+        for _ in range(in_flight):
             response = await self._conn.read_response(timeout=self.TIMEOUT_ACK)
             validate_ack_response(response, CommandCode.WRITE_CONFIG_CHUNK)
 
+        # The device reports the new config from now on; re-read it on next connect
+        if (cache := self._config_cache()) is not None:
+            cache.invalidate()
+
         _LOGGER.info("Config written successfully to %s", self.mac_address)
 
     def export_config_json(self, file_path: str) -> None:
@@ -668,10 +707,6 @@ class OpenDisplayDevice:
         if not self._config:
             raise ValueError("No config loaded - interrogate device first")
 
-        import json
-
-        from .models import config_to_json
-
         data = config_to_json(self._config)
 
         with open(file_path, "w", encoding="utf-8") as f:
@@ -702,10 +737,6 @@ class OpenDisplayDevice:
             async with OpenDisplayDevice(mac_address="AA:BB:CC:DD:EE:FF") as device:
                 await device.write_config(config)
         """
-        import json
-
-        from .models import config_from_json
-
         with open(file_path, encoding="utf-8") as f:
             data = json.load(f)
 
@@ -724,7 +755,9 @@ class OpenDisplayDevice:
         """Prepare image for upload.
 
         Handles optional source rotation, fitting, dithering, encoding,
-        and optional compression.
+        and optional compression. The last PREPARED_CACHE_SIZE results are
+        kept, so uploading an unchanged frame again skips all of it. Each call
+        returns its own copy of the processed image, so callers may modify it.
 
         Args:
             image: PIL Image to prepare
@@ -737,11 +770,36 @@ class OpenDisplayDevice:
         Returns:
             Tuple of (uncompressed_data, compressed_data or None, processed_image)
         """
-        panel_ic_type = self._config.displays[0].panel_ic_type if self._config and self._config.displays else None
-        return prepare_image(
+        capabilities = self._ensure_capabilities()
+        panel_ic_type = self._panel_ic_type()
+        if self._palette is None:
+            self._palette = resolve_palette(panel_ic_type, capabilities.color_scheme, self._use_measured_palettes)
+
+        cache_key: tuple[object, ...] | None = None
+        if self.PREPARED_CACHE_SIZE > 0:
+            cache_key = (
+                image.mode,
+                image.size,
+                image_fingerprint(image),
+                # prepare_image() converts sources with a transparency key to RGBA
+                image.info.get("transparency"),
+                dither_mode,
+                compress,
+                tone_compression,
+                fit,
+                rotate,
+            )
+            cached = self._prepared_cache.get(cache_key)
+            if cached is not None:
+                _LOGGER.debug("Reusing prepared data for unchanged image")
+                self._prepared_cache.move_to_end(cache_key)
+                uncompressed, compressed, processed = cached
+                return uncompressed, compressed, processed.copy()
+
+        prepared = prepare_image(
             image,
             config=self._config,
-            capabilities=self._ensure_capabilities(),
+            capabilities=capabilities,
             use_measured_palettes=self._use_measured_palettes,
             panel_ic_type=panel_ic_type,
             dither_mode=dither_mode,
@@ -749,12 +807,27 @@ class OpenDisplayDevice:
             tone_compression=tone_compression,
             fit=fit,
             rotate=rotate,
+            palette=self._palette,
         )
 
+        if cache_key is not None:
+            self._prepared_cache[cache_key] = prepared
+            while len(self._prepared_cache) > self.PREPARED_CACHE_SIZE:
+                self._prepared_cache.popitem(last=False)
+            # The cached image stays private to the cache
+            uncompressed, compressed, processed = prepared
+            return uncompressed, compressed, processed.copy()
+
+        return prepared
+
+    def _panel_ic_type(self) -> int | None:
+        """Return the first display's panel IC type, if config is known."""
+        return self._config.displays[0].panel_ic_type if self._config and self._config.displays else None
+
     @staticmethod
     def _rotate_source_image(image: Image.Image, rotate: Rotation) -> Image.Image:
         """Rotate source image by enum value before fitting."""
-        return _rotate_source_image(image, rotate)
+        return rotate_source_image(image, rotate)
 
     async def upload_image(
         self,
@@ -765,6 +838,7 @@ class OpenDisplayDevice:
         tone_compression: float | str = "auto",
         fit: FitMode = FitMode.CONTAIN,
         rotate: Rotation = Rotation.ROTATE_0,
+        progress_callback: Callable[[int, int], None] | None = None,
     ) -> Image.Image:
         """Upload image to device display.
 
@@ -790,6 +864,9 @@ class OpenDisplayDevice:
                 COVER - scale to cover, crop overflow
                 CROP - center-crop at native resolution, pad if smaller
             rotate: Source image rotation enum, applied before fit/encoding.
+            progress_callback: Optional callable receiving (bytes_sent, total_bytes)
+                after each DATA chunk is written. When compressing, counts include
+                the compressed bytes carried by the START command.
 
         Raises:
             RuntimeError: If device not interrogated/configured
@@ -809,9 +886,10 @@ class OpenDisplayDevice:
             self.color_scheme.name,
         )
 
-        # Prepare image (fit, dither, encode, compress)
-        image_data, compressed_data, processed_image = self._prepare_image(
-            image, dither_mode, compress, tone_compression, fit, rotate
+        # Prepare image (fit, dither, encode, compress) in a worker thread so the
+        # event loop keeps serving BLE traffic and other devices meanwhile
+        image_data, compressed_data, processed_image = await asyncio.to_thread(
+            self._prepare_image, image, dither_mode, compress, tone_compression, fit, rotate
         )
 
         # Choose protocol based on compression and size
@@ -823,13 +901,16 @@ class OpenDisplayDevice:
                 use_compression=True,
                 compressed_data=compressed_data,
                 uncompressed_size=len(image_data),
+                progress_callback=progress_callback,
             )
         else:
             if compress and compressed_data:
                 _LOGGER.info("Compressed size exceeds %d bytes, using uncompressed protocol", MAX_COMPRESSED_SIZE)
             else:
                 _LOGGER.info("Compression disabled, using uncompressed protocol")
-            await self._execute_upload(image_data, refresh_mode, use_compression=False)
+            await self._execute_upload(
+                image_data, refresh_mode, use_compression=False, progress_callback=progress_callback
+            )
 
         _LOGGER.info("Image upload complete")
         return processed_image
@@ -839,6 +920,7 @@ class OpenDisplayDevice:
         prepared_data: tuple[bytes, bytes | None, Image.Image],
         refresh_mode: RefreshMode = RefreshMode.FULL,
         compress: bool = True,
+        progress_callback: Callable[[int, int], None] | None = None,
     ) -> None:
         """Upload pre-computed image data to device.
 
@@ -851,6 +933,8 @@ class OpenDisplayDevice:
                 (uncompressed_data, compressed_data or None, processed_image)
             refresh_mode: Display refresh mode (default: FULL)
             compress: Whether to use compressed protocol if data is available
+            progress_callback: Optional callable receiving (bytes_sent, total_bytes)
+                after each DATA chunk is written (see upload_image())
 
         Raises:
             ProtocolError: If upload fails
@@ -865,13 +949,16 @@ class OpenDisplayDevice:
                 use_compression=True,
                 compressed_data=compressed_data,
                 uncompressed_size=len(image_data),
+                progress_callback=progress_callback,
             )
         else:
             if compress and compressed_data:
                 _LOGGER.info("Compressed size exceeds %d bytes, using uncompressed protocol", MAX_COMPRESSED_SIZE)
             else:
                 _LOGGER.info("Compression disabled or no compressed data, using uncompressed protocol")
-            await self._execute_upload(image_data, refresh_mode, use_compression=False)
+            await self._execute_upload(
+                image_data, refresh_mode, use_compression=False, progress_callback=progress_callback
+            )
 
         _LOGGER.info("Prepared image upload complete")
 
@@ -882,133 +969,31 @@ class OpenDisplayDevice:
         use_compression: bool = False,
         compressed_data: bytes | None = None,
         uncompressed_size: int | None = None,
+        progress_callback: Callable[[int, int], None] | None = None,
     ) -> None:
         """Execute image upload using compressed or uncompressed protocol.
 
-        Args:
-            image_data: Raw uncompressed image data (always needed for uncompressed)
-            refresh_mode: Display refresh mode
-            use_compression: True to use compressed protocol
-            compressed_data: Compressed data (required if use_compression=True)
-            uncompressed_size: Original size (required if use_compression=True)
+        Uses this device's CHUNK_SIZE, PIPELINE_CHUNKS and timeouts; see
+        DirectWriteTransfer.send() for the arguments.
 
         Raises:
             ProtocolError: If upload fails
         """
-        # 1. Send START command (different for each protocol)
-        if use_compression:
-            assert uncompressed_size is not None and compressed_data is not None
-            start_cmd, remaining_compressed = build_direct_write_start_compressed(uncompressed_size, compressed_data)
-        else:
-            start_cmd = build_direct_write_start_uncompressed()
-            remaining_compressed = None
-
-        await self._conn.write_command(start_cmd)
-
-        # 2. Wait for START ACK (identical for both protocols)
-        response = await self._conn.read_response(timeout=self.TIMEOUT_ACK)
-        validate_ack_response(response, CommandCode.DIRECT_WRITE_START)
-
-        # 3. Send data chunks
-        auto_completed = False
-        if use_compression:
-            # Compressed upload: send remaining compressed data as chunks
-            if remaining_compressed:
-                auto_completed = await self._send_data_chunks(remaining_compressed)
-        else:
-            # Uncompressed upload: send raw image data as chunks
-            auto_completed = await self._send_data_chunks(image_data)
-
-        # 4. Send END command if needed (identical for both protocols)
-        if not auto_completed:
-            end_cmd = build_direct_write_end_command(refresh_mode.value)
-            await self._conn.write_command(end_cmd)
-
-            # Wait for END ACK (90s timeout for display refresh)
-            response = await self._conn.read_response(timeout=self.TIMEOUT_REFRESH)
-            validate_ack_response(response, CommandCode.DIRECT_WRITE_END)
-
-    async def _send_data_chunks(self, image_data: bytes) -> bool:
-        """Send image data chunks with ACK handling.
-
-        Sends image data in chunks via 0x0071 DATA commands. Handles:
-        - Timeout recovery when firmware starts display refresh
-        - Auto-completion detection (firmware sends 0x0072 END early)
-        - Progress logging
-
-        Args:
-            image_data: Uncompressed encoded image data
-
-        Returns:
-            True if device auto-completed (sent 0x0072 END early)
-            False if all chunks sent normally (caller should send END)
-
-        Raises:
-            ProtocolError: If unexpected response received
-            BLETimeoutError: If no response within timeout
-        """
-        bytes_sent = 0
-        chunks_sent = 0
-
-        while bytes_sent < len(image_data):
-            # Get next chunk
-            chunk_start = bytes_sent
-            chunk_end = min(chunk_start + CHUNK_SIZE, len(image_data))
-            chunk_data = image_data[chunk_start:chunk_end]
-
-            # Send DATA command
-            data_cmd = build_direct_write_data_command(chunk_data)
-            await self._conn.write_command(data_cmd)
-
-            bytes_sent += len(chunk_data)
-            chunks_sent += 1
-
-            # Wait for response after every chunk (PIPELINE_CHUNKS=1)
-            try:
-                response = await self._conn.read_response(timeout=self.TIMEOUT_ACK)
-            except BLETimeoutError:
-                # Timeout on response - firmware might be doing display refresh
-                # This happens when the chunk completes directWriteTotalBytes
-                _LOGGER.info(
-                    "No response after chunk %d (%.1f%%), waiting for device refresh...",
-                    chunks_sent,
-                    bytes_sent / len(image_data) * 100,
-                )
-
-                # Wait up to 90 seconds for the END response
-                response = await self._conn.read_response(timeout=self.TIMEOUT_REFRESH)
-
-            # Check what response we got (firmware can send 0x0072 on ANY chunk, not just last!)
-            command, _ = check_response_type(response)
-
-            if command == CommandCode.DIRECT_WRITE_DATA:
-                # Normal DATA ACK (0x0071) - continue sending chunks
-                pass
-            elif command == CommandCode.DIRECT_WRITE_END:
-                # Firmware auto-triggered END (0x0072) after receiving all data
-                # This happens when last chunk completes directWriteTotalBytes
-                _LOGGER.info(
-                    "Received END response after chunk %d - device auto-completed",
-                    chunks_sent,
-                )
-                # Note: 0x0072 is sent AFTER display refresh completes (waitforrefresh(60))
-                # So we're already done - no need to send our own 0x0072 END command!
-                return True  # Auto-completed
-            else:
-                # Unexpected response
-                raise ProtocolError(f"Unexpected response: {command.name} (0x{command:04x})")
-
-            # Log progress every 50 chunks to reduce spam
-            if chunks_sent % 50 == 0 or bytes_sent >= len(image_data):
-                _LOGGER.debug(
-                    "Sent %d/%d bytes (%.1f%%)",
-                    bytes_sent,
-                    len(image_data),
-                    bytes_sent / len(image_data) * 100,
-                )
-
-        _LOGGER.debug("All data chunks sent (%d chunks total)", chunks_sent)
-        return False  # Normal completion, caller should send END
+        transfer = DirectWriteTransfer(
+            self._conn,
+            ack_timeout=self.TIMEOUT_ACK,
+            refresh_timeout=self.TIMEOUT_REFRESH,
+            chunk_size=self.CHUNK_SIZE,
+            pipeline_chunks=self.PIPELINE_CHUNKS,
+        )
+        await transfer.send(
+            image_data,
+            refresh_mode,
+            use_compression=use_compression,
+            compressed_data=compressed_data,
+            uncompressed_size=uncompressed_size,
+            progress_callback=progress_callback,
+        )
 
     def _extract_capabilities_from_config(self) -> DeviceCapabilities:
         """Extract DeviceCapabilities from GlobalConfig.
@@ -2,15 +2,26 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+import weakref
+from typing import TYPE_CHECKING
 
 from bleak import BleakScanner
 
 from .exceptions import BLETimeoutError
 from .protocol import MANUFACTURER_ID
 
+if TYPE_CHECKING:
+    from bleak.backends.device import BLEDevice
+    from bleak.backends.scanner import AdvertisementData
+
 _LOGGER = logging.getLogger(__name__)
 
+# Seconds a device seen by a shared name lookup can be reused without rescanning
+SHARED_SCAN_TTL = 30.0
+
 
 async def discover_devices(
     timeout: float = 10.0,
@@ -72,3 +83,125 @@ async def discover_devices(
 
     _LOGGER.info("Discovery complete: found %d OpenDisplay device(s)", len(result))
     return result
+
+
+def _names_for(device: BLEDevice) -> tuple[str, ...]:
+    """Return every name discover_devices() could list this device under."""
+    mac_suffix = device.address.replace(":", "")[-4:]
+    if device.name:
+        return device.name, f"{device.name}_{mac_suffix}"
+    return (f"Unknown_{mac_suffix}",)
+
+
+def _matches_name(device: BLEDevice, adv_data: AdvertisementData, name: str, manufacturer_id: int) -> bool:
+    """Check whether an advertisement is the device discover_devices() would list as name."""
+    if manufacturer_id not in adv_data.manufacturer_data:
+        return False
+
+    # Plain name, or the suffixed form discover_devices() gives duplicates
+    return name in _names_for(device)
+
+
+# Shared name lookups: devices seen by any shared scan, keyed by
+# (manufacturer_id, name) -> (monotonic time seen, device)
+_SHARED_SEEN: dict[tuple[int, str], tuple[float, BLEDevice]] = {}
+# One scan lock per event loop, so only one shared scan runs at a time
+_SHARED_SCAN_LOCKS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock] = weakref.WeakKeyDictionary()
+
+
+def _recent_sighting(name: str, manufacturer_id: int) -> BLEDevice | None:
+    """Return a device seen under name by a shared scan within the TTL, if any."""
+    entry = _SHARED_SEEN.get((manufacturer_id, name))
+    if entry is None or time.monotonic() - entry[0] > SHARED_SCAN_TTL:
+        return None
+    return entry[1]
+
+
+def _remember_sighting(device: BLEDevice, manufacturer_id: int) -> tuple[str, ...]:
+    """Record a shared-scan sighting under its discover_devices() names.
+
+    Entries older than SHARED_SCAN_TTL are dropped first, so the table only
+    holds devices that could still be reused.
+
+    Returns:
+        The names the device was seen under
+    """
+    now = time.monotonic()
+    for key in [key for key, (seen_at, _) in _SHARED_SEEN.items() if now - seen_at > SHARED_SCAN_TTL]:
+        del _SHARED_SEEN[key]
+
+    names = _names_for(device)
+    for seen_name in names:
+        # First device seen keeps a name, as in discover_devices()
+        entry = _SHARED_SEEN.get((manufacturer_id, seen_name))
+        if entry is None or entry[1].address == device.address:
+            _SHARED_SEEN[(manufacturer_id, seen_name)] = (now, device)
+    return names
+
+
+async def _find_device_shared(name: str, timeout: float, manufacturer_id: int) -> BLEDevice | None:
+    """Find a device by name, reusing recent sightings from any shared scan.
+
+    Only one shared scan runs at a time. Every OpenDisplay advertisement seen
+    while scanning is remembered, so lookups queued behind a scan usually
+    find their device without scanning again.
+    """
+    if (device := _recent_sighting(name, manufacturer_id)) is not None:
+        return device
+
+    lock = _SHARED_SCAN_LOCKS.setdefault(asyncio.get_running_loop(), asyncio.Lock())
+    async with lock:
+        # The scan we queued behind may have seen this device
+        if (device := _recent_sighting(name, manufacturer_id)) is not None:
+            _LOGGER.debug("Device '%s' seen by a shared scan", name)
+            return device
+
+        def remember(device: BLEDevice, adv_data: AdvertisementData) -> bool:
+            if manufacturer_id not in adv_data.manufacturer_data:
+                return False
+            return name in _remember_sighting(device, manufacturer_id)
+
+        _LOGGER.debug("Shared scan for device '%s' (timeout=%ds)", name, timeout)
+        try:
+            return await BleakScanner.find_device_by_filter(remember, timeout=timeout)
+        except Exception as e:
+            raise BLETimeoutError(f"BLE scan failed: {e}") from e
+
+
+async def find_device_by_name(
+    name: str,
+    timeout: float = 10.0,
+    manufacturer_id: int = MANUFACTURER_ID,
+    shared: bool = False,
+) -> BLEDevice | None:
+    """Scan for one OpenDisplay device by name, stopping as soon as it is seen.
+
+    Names follow the same scheme as discover_devices(), including the
+    "Unknown_{last_4}" and "{name}_{last_4}" fallbacks.
+
+    Args:
+        name: Device name as reported by discover_devices()
+        timeout: Maximum scan duration in seconds (default: 10.0)
+        manufacturer_id: Manufacturer ID to filter (default: 0x2446)
+        shared: Take turns on one scan with other shared lookups and reuse
+            devices any of them saw in the last SHARED_SCAN_TTL seconds,
+            instead of scanning independently (default: False)
+
+    Returns:
+        BLEDevice of the first matching device, or None if not found in time
+
+    Raises:
+        BLETimeoutError: If scan fails to complete
+    """
+    if shared:
+        return await _find_device_shared(name, timeout, manufacturer_id)
+
+    _LOGGER.debug("Scanning for device '%s' (timeout=%ds)", name, timeout)
+
+    try:
+        return await BleakScanner.find_device_by_filter(
+            lambda device, adv_data: _matches_name(device, adv_data, name, manufacturer_id),
+            timeout=timeout,
+        )
+    except Exception as e:
+        raise BLETimeoutError(f"BLE scan failed: {e}") from e
@@ -1,5 +1,7 @@
 """Automatic measured palette selection and panel capability data for e-paper displays."""
 
+from functools import lru_cache
+
 from epaper_dithering import (
     BWRY_3_97,
     MONO_4_26,
@@ -41,6 +43,15 @@ DISPLAY_PALETTE_MAP: dict[tuple[int, ColorScheme], ColorPalette] = {
 }
 
 
+@lru_cache(maxsize=32)
+def _color_scheme_from_value(value: int) -> ColorScheme:
+    """Cached ColorScheme.from_value(), which scans every member per call.
+
+    Invalid values still raise ValueError on each call (exceptions are not cached).
+    """
+    return ColorScheme.from_value(value)
+
+
 def get_palette_for_display(
     panel_ic_type: int | None,
     color_scheme: ColorScheme | int,
@@ -59,7 +70,7 @@ def get_palette_for_display(
     Returns:
         ColorPalette if measured data exists and use_measured=True, otherwise ColorScheme enum
     """
-    scheme = color_scheme if isinstance(color_scheme, ColorScheme) else ColorScheme.from_value(color_scheme)
+    scheme = color_scheme if isinstance(color_scheme, ColorScheme) else _color_scheme_from_value(color_scheme)
 
     if use_measured and panel_ic_type is not None:
         key = (panel_ic_type, scheme)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from typing import overload
 
 import numpy as np
 from epaper_dithering import ColorScheme
@@ -11,10 +12,23 @@ from PIL import Image
 _LOGGER = logging.getLogger(__name__)
 
 
+@overload
+def encode_bitplanes(image: Image.Image, color_scheme: ColorScheme, out: None = None) -> tuple[bytes, bytes]: ...
+
+
+@overload
+def encode_bitplanes(
+    image: Image.Image,
+    color_scheme: ColorScheme,
+    out: bytearray,
+) -> tuple[memoryview, memoryview]: ...
+
+
 def encode_bitplanes(
     image: Image.Image,
     color_scheme: ColorScheme,
-) -> tuple[bytes, bytes]:
+    out: bytearray | None = None,
+) -> tuple[bytes, bytes] | tuple[memoryview, memoryview]:
     """Encode image to bitplane format for BWR/BWY displays.
 
     BWR/BWY displays use two bitplanes:
@@ -24,12 +38,16 @@ def encode_bitplanes(
     Args:
         image: Dithered palette image
         color_scheme: Must be BWR or BWY
+        out: Optional buffer of exactly 2 * plane size bytes.
+            Plane 1 is written to the first half and plane 2 to the second,
+            so callers that send both planes back-to-back avoid concatenating.
 
     Returns:
-        Tuple of (plane1_bytes, plane2_bytes)
+        Tuple of (plane1_bytes, plane2_bytes), or memoryviews into ``out``
+        when a buffer was provided
 
     Raises:
-        ValueError: If color_scheme is not BWR or BWY
+        ValueError: If color_scheme is not BWR or BWY, or out has the wrong size
     """
     if color_scheme not in (ColorScheme.BWR, ColorScheme.BWY):
         raise ValueError(f"Bitplane encoding only supports BWR/BWY, got {color_scheme.name}")
@@ -37,32 +55,33 @@ def encode_bitplanes(
     if image.mode != "P":
         raise ValueError(f"Expected palette image, got {image.mode}")
 
-    pixels = np.array(image)
+    pixels = np.asarray(image)
     height, width = pixels.shape
 
     # Calculate output size (1bpp, 8 pixels per byte)
     bytes_per_row = (width + 7) // 8
-    plane1 = bytearray(bytes_per_row * height)  # BW plane
-    plane2 = bytearray(bytes_per_row * height)  # R/Y plane
+    plane_size = bytes_per_row * height
+
+    # Both planes share one buffer: BW plane first, R/Y plane second
+    if out is None:
+        buffer = bytearray(2 * plane_size)
+    elif len(out) != 2 * plane_size:
+        raise ValueError(f"Output buffer must be {2 * plane_size} bytes, got {len(out)}")
+    else:
+        buffer = out
 
     # Palette mapping:
     # Index 0 = Black -> BW=0, R/Y=0
     # Index 1 = White -> BW=1, R/Y=0
     # Index 2 = Red/Yellow -> BW=0, R/Y=1
-
-    for y in range(height):
-        for x in range(width):
-            byte_idx = y * bytes_per_row + x // 8
-            bit_idx = 7 - (x % 8)  # MSB first
-
-            palette_idx = pixels[y, x]
-
-            if palette_idx == 1:
-                # White - set BW plane
-                plane1[byte_idx] |= 1 << bit_idx
-            elif palette_idx == 2:
-                # Red/Yellow - set R/Y plane
-                plane2[byte_idx] |= 1 << bit_idx
-            # else: palette_idx == 0 (black) - both planes stay 0
-
-    return bytes(plane1), bytes(plane2)
+    #
+    # Each plane is packed straight from the palette index array, MSB first.
+    # np.packbits pads every row to a whole byte, matching bytes_per_row.
+    planes = np.frombuffer(buffer, dtype=np.uint8).reshape(2, height, bytes_per_row)
+    planes[0] = np.packbits(pixels == 1, axis=1)
+    planes[1] = np.packbits(pixels == 2, axis=1)
+
+    view = memoryview(buffer)
+    if out is None:
+        return bytes(view[:plane_size]), bytes(view[plane_size:])
+    return view[:plane_size], view[plane_size:]
@@ -8,7 +8,13 @@ import zlib
 _LOGGER = logging.getLogger(__name__)
 
 
-def compress_image_data(data: bytes, level: int = 6) -> bytes:
+def compress_image_data(
+    data: bytes,
+    level: int = 6,
+    *,
+    wbits: int = zlib.MAX_WBITS,
+    strategy: int = zlib.Z_DEFAULT_STRATEGY,
+) -> bytes:
     """Compress image data using zlib.
 
     Args:
@@ -18,6 +24,14 @@ def compress_image_data(data: bytes, level: int = 6) -> bytes:
             1 = fastest
             6 = default balance
             9 = best compression
+        wbits: Window size and container format, as for zlib.compressobj
+            (default: zlib.MAX_WBITS, a zlib stream with header and checksum).
+            Negative values produce raw deflate, 6 bytes shorter, for
+            decoders that expect no zlib wrapper.
+        strategy: Deflate match strategy (default: zlib.Z_DEFAULT_STRATEGY).
+            zlib.Z_RLE only matches runs of the previous byte; it is several
+            times faster and can beat the default on noisy dithered images,
+            but loses badly on text and line art.
 
     Returns:
         Compressed data
@@ -25,7 +39,8 @@ def compress_image_data(data: bytes, level: int = 6) -> bytes:
     if level == 0:
         return data
 
-    compressed = zlib.compress(data, level=level)
+    compressor = zlib.compressobj(level, zlib.DEFLATED, wbits, strategy=strategy)
+    compressed = compressor.compress(data) + compressor.flush()
 
     ratio = len(compressed) / len(data) * 100 if data else 0
     _LOGGER.debug(
@@ -38,11 +53,12 @@ def compress_image_data(data: bytes, level: int = 6) -> bytes:
     return compressed
 
 
-def decompress_image_data(data: bytes) -> bytes:
+def decompress_image_data(data: bytes, *, wbits: int = zlib.MAX_WBITS) -> bytes:
     """Decompress zlib-compressed image data.
 
     Args:
         data: Compressed data
+        wbits: Must match the value used by compress_image_data (default: zlib.MAX_WBITS)
 
     Returns:
         Decompressed data
@@ -50,4 +66,4 @@ def decompress_image_data(data: bytes) -> bytes:
     Raises:
         zlib.error: If decompression fails
     """
-    return zlib.decompress(data)
+    return zlib.decompress(data, wbits=wbits)
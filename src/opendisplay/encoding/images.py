@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
+from functools import partial
 
 import numpy as np
 from epaper_dithering import ColorScheme
@@ -15,6 +17,18 @@ _LOGGER = logging.getLogger(__name__)
 # Fill color for CONTAIN and CROP padding (white, natural for e-paper)
 _PAD_COLOR = (255, 255, 255)
 
+# Large downscales first shrink with a cheap box reduce() so that LANCZOS only
+# covers the last ~3x; Pillow documents 3.0 as indistinguishable from a full pass
+_REDUCING_GAP = 3.0
+
+
+def _prereduce(image: Image.Image, scale: float) -> Image.Image:
+    """Box-reduce an image by the integer factor that keeps a _REDUCING_GAP margin."""
+    if image.mode in ("1", "P"):
+        return image  # Pillow resamples these with NEAREST; reduce() does not apply
+    factor = int(1 / (scale * _REDUCING_GAP))
+    return image.reduce(factor) if factor >= 2 else image
+
 
 def fit_image(
     image: Image.Image,
@@ -32,12 +46,16 @@ def fit_image(
         Image with exact target dimensions
     """
     if fit == FitMode.STRETCH:
-        return image.resize(target_size, Image.Resampling.LANCZOS)
+        return image.resize(target_size, Image.Resampling.LANCZOS, reducing_gap=_REDUCING_GAP)
 
     if fit == FitMode.CONTAIN:
+        scale = min(target_size[0] / image.width, target_size[1] / image.height)
+        image = _prereduce(image, scale)
         return ImageOps.pad(image, target_size, Image.Resampling.LANCZOS, color=_PAD_COLOR)
 
     if fit == FitMode.COVER:
+        scale = max(target_size[0] / image.width, target_size[1] / image.height)
+        image = _prereduce(image, scale)
         return ImageOps.fit(image, target_size, Image.Resampling.LANCZOS)
 
     if fit == FitMode.CROP:
@@ -48,15 +66,21 @@ def fit_image(
         crop_w, crop_h = min(sw, tw), min(sh, th)
         left = (sw - crop_w) // 2
         top = (sh - crop_h) // 2
-        cropped = image.crop((left, top, left + crop_w, top + crop_h))
+        box = (left, top, left + crop_w, top + crop_h)
 
         # Paste centered onto white canvas if padding needed
         if crop_w == tw and crop_h == th:
-            return cropped
+            return image.crop(box)
         canvas = Image.new("RGB", target_size, _PAD_COLOR)
         paste_x = (tw - crop_w) // 2
         paste_y = (th - crop_h) // 2
-        canvas.paste(cropped, (paste_x, paste_y))
+        if image.mode == canvas.mode:
+            # paste() clips to the canvas, so the crop region lands in place
+            # without copying it out first
+            canvas.paste(image, (paste_x - left, paste_y - top))
+        else:
+            # Crop first so only the visible region is converted to RGB
+            canvas.paste(image.crop(box), (paste_x, paste_y))
         return canvas
 
     raise ValueError(f"Unknown fit mode: {fit}")
@@ -75,54 +99,50 @@ def encode_image(
     Returns:
         Encoded image bytes
     """
-
-    if color_scheme == ColorScheme.MONO:
-        return encode_1bpp(image)
+    encoder = _ENCODERS.get(color_scheme)
+    if encoder is not None:
+        return encoder(image)
     if color_scheme in (ColorScheme.BWR, ColorScheme.BWY):
         # 3-color displays use bitplane encoding (handled separately)
         raise ValueError(f"Color scheme {color_scheme.name} requires bitplane encoding, use encode_bitplanes() instead")
-    if color_scheme == ColorScheme.BWRY:
-        return encode_2bpp(image)
-    if color_scheme == ColorScheme.BWGBRY:
-        # 6-color Spectra 6 display uses 4bpp with special firmware values
-        # Palette indices 0-5 map to firmware values 0,1,2,3,5,6 (4 is skipped!)
-        return encode_4bpp(image, bwgbry_mapping=True)
-    if color_scheme == ColorScheme.GRAYSCALE_4:
-        return encode_2bpp(image)
     raise ValueError(f"Unsupported color scheme: {color_scheme}")
 
 
+def _pad_rows(pixels: np.ndarray, pixels_per_byte: int) -> np.ndarray:
+    """Zero-pad each row so its width is a whole number of output bytes."""
+    remainder = pixels.shape[1] % pixels_per_byte
+    if remainder == 0:
+        return pixels
+    return np.pad(pixels, ((0, 0), (0, pixels_per_byte - remainder)))
+
+
 def encode_1bpp(image: Image.Image) -> bytes:
     """Encode image to 1-bit-per-pixel format (monochrome).
 
     Format: 8 pixels per byte, MSB first
     Palette index 0 = black (0), index 1 = white (1)
 
+    Bilevel (mode '1') images are already stored in this layout, so they are
+    returned as their raw buffer without repacking.
+
     Args:
-        image: Palette image (mode 'P')
+        image: Palette image (mode 'P') or bilevel image (mode '1')
 
     Returns:
         Encoded bytes
     """
+    if image.mode == "1":
+        # Pillow packs mode '1' rows MSB first, padded to bytes, 1 = white
+        return image.tobytes("raw", "1")
     if image.mode != "P":
         raise ValueError(f"Expected palette image, got {image.mode}")
 
-    pixels = np.array(image)
-    height, width = pixels.shape
-
-    # Calculate output size (round up to byte boundary)
-    bytes_per_row = (width + 7) // 8
-    output = bytearray(bytes_per_row * height)
-
-    for y in range(height):
-        for x in range(width):
-            byte_idx = y * bytes_per_row + x // 8
-            bit_idx = 7 - (x % 8)  # MSB first
-
-            if pixels[y, x] > 0:  # Non-zero palette index = white
-                output[byte_idx] |= 1 << bit_idx
+    pixels = np.asarray(image)
 
-    return bytes(output)
+    # Non-zero palette index = white. packbits already packs any non-zero byte
+    # as a 1 bit, so the indices go in directly without a boolean mask copy;
+    # it also pads each row to a byte boundary
+    return np.packbits(pixels, axis=1).tobytes()
 
 
 def encode_2bpp(image: Image.Image) -> bytes:
@@ -140,23 +160,13 @@ def encode_2bpp(image: Image.Image) -> bytes:
     if image.mode != "P":
         raise ValueError(f"Expected palette image, got {image.mode}")
 
-    pixels = np.array(image)
-    height, width = pixels.shape
+    # Round each row up to a 4-pixel boundary, then view each group of 4 pixels
+    # as one little-endian u32 (first pixel in the low byte) and shift every
+    # pixel into its bit pair; the u8 cast keeps just the packed low byte
+    quads = _pad_rows(np.asarray(image) & 0x03, 4).view("<u4")
 
-    # Calculate output size (round up to 4-pixel boundary)
-    bytes_per_row = (width + 3) // 4
-    output = bytearray(bytes_per_row * height)
-
-    for y in range(height):
-        for x in range(width):
-            byte_idx = y * bytes_per_row + x // 4
-            pixel_in_byte = x % 4
-            bit_shift = (3 - pixel_in_byte) * 2  # MSB first
-
-            palette_idx = pixels[y, x] & 0x03  # 2-bit value
-            output[byte_idx] |= palette_idx << bit_shift
-
-    return bytes(output)
+    packed: np.ndarray = (quads << 6) | (quads >> 4) | (quads >> 14) | (quads >> 24)
+    return packed.astype(np.uint8).tobytes()
 
 
 def encode_4bpp(image: Image.Image, bwgbry_mapping: bool = False) -> bytes:
@@ -176,32 +186,30 @@ def encode_4bpp(image: Image.Image, bwgbry_mapping: bool = False) -> bytes:
     if image.mode != "P":
         raise ValueError(f"Expected palette image, got {image.mode}")
 
-    pixels = np.array(image)
-    height, width = pixels.shape
-
-    # BWGBRY firmware color mapping (Spectra 6 display)
-    # Palette indices to firmware values: 0→0, 1→1, 2→2, 3→3, 4→5, 5→6
-    BWGBRY_MAP = {0: 0, 1: 1, 2: 2, 3: 3, 4: 5, 5: 6}
-
-    # Calculate output size (round up to 2-pixel boundary)
-    bytes_per_row = (width + 1) // 2
-    output = bytearray(bytes_per_row * height)
-
-    for y in range(height):
-        for x in range(width):
-            byte_idx = y * bytes_per_row + x // 2
-
-            palette_idx = pixels[y, x] & 0x0F  # 4-bit value
-
-            # Apply BWGBRY mapping if needed
-            if bwgbry_mapping:
-                palette_idx = BWGBRY_MAP.get(palette_idx, 0)
-
-            if x % 2 == 0:
-                # High nibble
-                output[byte_idx] |= palette_idx << 4
-            else:
-                # Low nibble
-                output[byte_idx] |= palette_idx
-
-    return bytes(output)
+    pixels = np.asarray(image) & 0x0F  # 4-bit value, a fresh array safe to modify
+
+    # Apply BWGBRY mapping if needed: 0→0, 1→1, 2→2, 3→3, 4→5, 5→6, others→0.
+    # Done in place with arithmetic; a uint8-indexed table lookup is several
+    # times slower and allocates another full-size array
+    if bwgbry_mapping:
+        pixels += pixels >= 4
+        pixels *= pixels <= 6
+
+    # Round each row up to a 2-pixel boundary, then view each pixel pair as one
+    # little-endian u16. High nibble = even pixel (low byte), low nibble = odd
+    # pixel (high byte); the u8 cast drops the bits shifted past the nibbles
+    pairs = _pad_rows(pixels, 2).view("<u2")
+
+    packed: np.ndarray = (pairs << 4) | (pairs >> 8)
+    return packed.astype(np.uint8).tobytes()
+
+
+# Packed encoder per color scheme, looked up once per encode_image() call
+_ENCODERS: dict[ColorScheme, Callable[[Image.Image], bytes]] = {
+    ColorScheme.MONO: encode_1bpp,
+    ColorScheme.BWRY: encode_2bpp,
+    # 6-color Spectra 6 display uses 4bpp with special firmware values
+    # Palette indices 0-5 map to firmware values 0,1,2,3,5,6 (4 is skipped!)
+    ColorScheme.BWGBRY: partial(encode_4bpp, bwgbry_mapping=True),
+    ColorScheme.GRAYSCALE_4: encode_2bpp,
+}
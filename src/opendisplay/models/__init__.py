@@ -23,8 +23,10 @@ from .config import (
 )
 from .config_json import config_from_json, config_to_json
 from .enums import (
+    AdvertisementFormat,
     BoardManufacturer,
     BusType,
+    ButtonEventType,
     DIYBoardType,
     FitMode,
     ICType,
@@ -41,6 +43,7 @@ from .led_flash import LedFlashConfig, LedFlashStep
 
 __all__ = [
     "AdvertisementData",
+    "AdvertisementFormat",
     "AdvertisementTracker",
     "ButtonChangeEvent",
     "ButtonEventData",
@@ -49,6 +52,7 @@ __all__ = [
     "BinaryInputs",
     "BoardManufacturer",
     "BusType",
+    "ButtonEventType",
     "DIYBoardType",
     "config_from_json",
     "config_to_json",
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import functools
 import struct
 import time
-from dataclasses import dataclass, field
+from dataclasses import astuple, dataclass, field
+from typing import Any
 
+from .enums import AdvertisementFormat, ButtonEventType
 
-@dataclass
+
+@dataclass(slots=True)
 class AdvertisementData:
     """Parsed BLE advertisement manufacturer data.
 
@@ -36,7 +40,7 @@ class AdvertisementData:
         battery_mv: Battery voltage in millivolts
         temperature_c: Chip temperature in Celsius
         loop_counter: Incrementing counter for each advertisement
-        format_version: Parsed advertisement format ("legacy" or "v1")
+        format_version: Parsed advertisement format (AdvertisementFormat.LEGACY or .V1)
         reboot_flag: Reboot flag from status byte (v1 only)
         connection_requested: Connection-request flag from status byte (v1 only)
         dynamic_data: Dynamic return data block (v1 only)
@@ -45,12 +49,17 @@ class AdvertisementData:
     battery_mv: int
     temperature_c: float
     loop_counter: int
-    format_version: str = "legacy"
+    format_version: AdvertisementFormat = AdvertisementFormat.LEGACY
     reboot_flag: bool | None = None
     connection_requested: bool | None = None
     dynamic_data: bytes = field(default_factory=bytes)
     raw_data: bytes = field(default_factory=bytes)
 
+    @property
+    def dynamic_hex(self) -> str:
+        """Hex string of dynamic_data."""
+        return self.dynamic_data.hex()
+
     def button_event(self, byte_index: int) -> ButtonEventData | None:
         """Decode one dynamic return byte as button data (v1 only).
 
@@ -63,7 +72,7 @@ class AdvertisementData:
         Raises:
             IndexError: If byte_index is outside 0-10
         """
-        if self.format_version != "v1":
+        if self.format_version != AdvertisementFormat.V1:
             return None
         if byte_index < 0 or byte_index >= len(self.dynamic_data):
             raise IndexError(f"button byte index out of range: {byte_index}")
@@ -79,12 +88,12 @@ class AdvertisementData:
     @property
     def button_events(self) -> list[ButtonEventData]:
         """Decode all dynamic return bytes as button event data (v1 only)."""
-        if self.format_version != "v1":
+        if self.format_version != AdvertisementFormat.V1:
             return []
         return [decode_button_event(raw, i) for i, raw in enumerate(self.dynamic_data)]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ButtonEventData:
     """Decoded button data stored in one v1 dynamic byte."""
 
@@ -95,13 +104,13 @@ class ButtonEventData:
     pressed: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ButtonChangeEvent:
     """State transition emitted by AdvertisementTracker."""
 
     address: str
     byte_index: int
-    event_type: str
+    event_type: ButtonEventType
     button_id: int
     pressed: bool
     press_count: int
@@ -129,7 +138,8 @@ class AdvertisementTracker:
     """
 
     def __init__(self) -> None:
-        self._last_by_address: dict[str, list[ButtonEventData]] = {}
+        # Last dynamic_data block per device; buttons are decoded only where bytes differ
+        self._last_by_address: dict[str, bytes] = {}
 
     def reset(self, address: str | None = None) -> None:
         """Reset tracker state for one device or all devices."""
@@ -145,30 +155,34 @@ class AdvertisementTracker:
         timestamp: float | None = None,
     ) -> list[ButtonChangeEvent]:
         """Process one advertisement and return detected transitions."""
-        if advertisement.format_version != "v1":
+        if advertisement.format_version != AdvertisementFormat.V1:
             self._last_by_address.pop(address, None)
             return []
 
-        current = advertisement.button_events
-        previous = self._last_by_address.get(address)
-        self._last_by_address[address] = current
+        current_data = advertisement.dynamic_data
+        previous_data = self._last_by_address.get(address)
+        self._last_by_address[address] = current_data
 
-        if previous is None or len(previous) != len(current):
+        # Whole-block comparison is a single memcmp; most packets stop here
+        if previous_data is None or previous_data == current_data or len(previous_data) != len(current_data):
             return []
 
         now = timestamp if timestamp is not None else time.time()
         events: list[ButtonChangeEvent] = []
 
-        for prev, curr in zip(previous, current, strict=False):
-            if prev.raw == curr.raw:
+        for byte_index, (prev_raw, curr_raw) in enumerate(zip(previous_data, current_data, strict=True)):
+            if prev_raw == curr_raw:
                 continue
 
+            prev = decode_button_event(prev_raw, byte_index)
+            curr = decode_button_event(curr_raw, byte_index)
+
             if prev.button_id != curr.button_id:
                 events.append(
                     ButtonChangeEvent(
                         address=address,
                         byte_index=curr.byte_index,
-                        event_type="button_slot_changed",
+                        event_type=ButtonEventType.BUTTON_SLOT_CHANGED,
                         button_id=curr.button_id,
                         pressed=curr.pressed,
                         press_count=curr.press_count,
@@ -185,7 +199,7 @@ class AdvertisementTracker:
                     ButtonChangeEvent(
                         address=address,
                         byte_index=curr.byte_index,
-                        event_type="button_down" if curr.pressed else "button_up",
+                        event_type=ButtonEventType.BUTTON_DOWN if curr.pressed else ButtonEventType.BUTTON_UP,
                         button_id=curr.button_id,
                         pressed=curr.pressed,
                         press_count=curr.press_count,
@@ -201,7 +215,7 @@ class AdvertisementTracker:
                     ButtonChangeEvent(
                         address=address,
                         byte_index=curr.byte_index,
-                        event_type="press_count_changed",
+                        event_type=ButtonEventType.PRESS_COUNT_CHANGED,
                         button_id=curr.button_id,
                         pressed=curr.pressed,
                         press_count=curr.press_count,
@@ -220,6 +234,13 @@ V1_LENGTH = 14
 MANUFACTURER_ID_LE = b"\x46\x24"
 LEGACY_PREFIX = b"\x02\x36\x00\x6c\x00\xc3\x01"
 
+# Precompiled layouts (format string parsed once, decoded with unpack_from)
+_LEGACY_FIELDS = struct.Struct("<HbB")  # battery_mv, temperature_c, loop_counter at offset 7
+_V1_FIELDS = struct.Struct("<11sBBB")  # dynamic_data, temperature, battery low byte, status
+
+# Distinct payloads kept by parse_advertisement(shared=True)
+_SHARED_CACHE_SIZE = 128
+
 
 def _strip_manufacturer_id(data: bytes) -> bytes:
     """Strip manufacturer ID prefix if present."""
@@ -230,42 +251,35 @@ def _strip_manufacturer_id(data: bytes) -> bytes:
 
 def _parse_legacy(data: bytes) -> AdvertisementData:
     """Parse legacy 11-byte advertisement data."""
-    battery_mv = struct.unpack("<H", data[7:9])[0]  # uint16, little-endian
-    temperature_c = float(struct.unpack("b", data[9:10])[0])  # int8, signed
-    loop_counter = data[10]  # uint8
+    # uint16 little-endian battery, int8 signed temperature, uint8 loop counter
+    battery_mv, temperature, loop_counter = _LEGACY_FIELDS.unpack_from(data, 7)
 
     return AdvertisementData(
         battery_mv=battery_mv,
-        temperature_c=temperature_c,
+        temperature_c=float(temperature),
         loop_counter=loop_counter,
-        format_version="legacy",
+        format_version=AdvertisementFormat.LEGACY,
         raw_data=data[:LEGACY_LENGTH],
     )
 
 
 def _parse_v1(data: bytes) -> AdvertisementData:
     """Parse v1 14-byte advertisement data (firmware 1.0+)."""
-    dynamic_data = data[0:11]
-    temperature_c = (data[11] / 2.0) - 40.0
-    battery_10mv = data[12] | ((data[13] & 0x01) << 8)
-    battery_mv = battery_10mv * 10
-    reboot_flag = bool(data[13] & 0x02)
-    connection_requested = bool(data[13] & 0x04)
-    loop_counter = (data[13] >> 4) & 0x0F
+    dynamic_data, temperature, battery_low, status = _V1_FIELDS.unpack_from(data)
 
     return AdvertisementData(
-        battery_mv=battery_mv,
-        temperature_c=temperature_c,
-        loop_counter=loop_counter,
-        format_version="v1",
-        reboot_flag=reboot_flag,
-        connection_requested=connection_requested,
+        battery_mv=(battery_low | ((status & 0x01) << 8)) * 10,
+        temperature_c=(temperature / 2.0) - 40.0,
+        loop_counter=(status >> 4) & 0x0F,
+        format_version=AdvertisementFormat.V1,
+        reboot_flag=bool(status & 0x02),
+        connection_requested=bool(status & 0x04),
         dynamic_data=dynamic_data,
         raw_data=data[:V1_LENGTH],
     )
 
 
-def parse_advertisement(data: bytes) -> AdvertisementData:
+def parse_advertisement(data: bytes, *, shared: bool = False) -> AdvertisementData:
     """Parse BLE advertisement manufacturer data.
 
     Note: The manufacturer ID (0x2446) is already stripped by Bleak
@@ -274,6 +288,9 @@ def parse_advertisement(data: bytes) -> AdvertisementData:
 
     Args:
         data: Raw manufacturer data in legacy (11 bytes) or v1 (14 bytes) format.
+        shared: Reuse decoded values for recently seen payloads. Tags repeat
+            the same payload until their state changes, so repeats skip
+            decoding. Each call still returns its own instance.
 
     Returns:
         AdvertisementData with parsed values
@@ -281,6 +298,9 @@ def parse_advertisement(data: bytes) -> AdvertisementData:
     Raises:
         ValueError: If data is too short or has an unsupported format
     """
+    if shared:
+        return AdvertisementData(*_parse_shared(bytes(data)))
+
     payload = _strip_manufacturer_id(data)
 
     if len(payload) < LEGACY_LENGTH:
@@ -298,3 +318,9 @@ def parse_advertisement(data: bytes) -> AdvertisementData:
         return _parse_legacy(payload)
 
     raise ValueError(f"Unsupported advertisement format ({len(payload)} bytes)")
+
+
+@functools.lru_cache(maxsize=_SHARED_CACHE_SIZE)
+def _parse_shared(data: bytes) -> tuple[Any, ...]:
+    """Parse and memoize one payload's field values for parse_advertisement(shared=True)."""
+    return astuple(parse_advertisement(data))
@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from epaper_dithering import ColorScheme
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceCapabilities:
     """Minimal device information needed for image upload."""
 
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from enum import IntEnum
+from enum import IntEnum, StrEnum
 from typing import Final
 
 
@@ -198,3 +198,25 @@ class FitMode(IntEnum):
     CONTAIN = 1  # Scale to fit within bounds, pad empty space with white
     COVER = 2  # Scale to cover bounds, crop overflow (no distortion)
     CROP = 3  # No scaling, center-crop at native resolution (pad if smaller)
+
+
+class AdvertisementFormat(StrEnum):
+    """BLE advertisement payload layouts.
+
+    Members compare equal to their plain string values ("legacy", "v1").
+    """
+
+    LEGACY = "legacy"  # 11-byte payload (pre-1.0 firmware)
+    V1 = "v1"  # 14-byte payload with dynamic return data (firmware 1.0+)
+
+
+class ButtonEventType(StrEnum):
+    """Button transitions reported by AdvertisementTracker.
+
+    Members compare equal to their plain string values (e.g. "button_down").
+    """
+
+    BUTTON_SLOT_CHANGED = "button_slot_changed"  # Dynamic byte now reports a different button
+    BUTTON_DOWN = "button_down"
+    BUTTON_UP = "button_up"
+    PRESS_COUNT_CHANGED = "press_count_changed"
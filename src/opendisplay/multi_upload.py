@@ -0,0 +1,105 @@
+"""Concurrent uploads of one image to several devices."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from epaper_dithering import DitherMode
+
+from .models.enums import FitMode, RefreshMode, Rotation
+from .preparation import prepare_image
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from epaper_dithering import ColorScheme
+    from PIL import Image
+
+    from .device import OpenDisplayDevice
+
+
+async def upload_to_many(
+    devices: Sequence[OpenDisplayDevice],
+    image: Image.Image,
+    refresh_mode: RefreshMode = RefreshMode.FULL,
+    dither_mode: DitherMode = DitherMode.BURKES,
+    compress: bool = True,
+    tone_compression: float | str = "auto",
+    fit: FitMode = FitMode.CONTAIN,
+    rotate: Rotation = Rotation.ROTATE_0,
+) -> list[Image.Image]:
+    """Upload one image to several connected devices concurrently.
+
+    Devices with the same display (size, color scheme, panel IC and palette
+    choice) share a single prepared image, so dithering and compression run
+    once per distinct display rather than once per device. BLE transfers to
+    all devices then run concurrently.
+
+    Args:
+        devices: Connected devices (each inside its async context manager)
+        image: PIL Image to display
+        refresh_mode: Display refresh mode (default: FULL)
+        dither_mode: Dithering algorithm (default: BURKES)
+        compress: Enable zlib compression (default: True)
+        tone_compression: Dynamic range compression ("auto", or 0.0-1.0)
+        fit: How to map the image to display dimensions (default: CONTAIN)
+        rotate: Source image rotation enum, applied before fit/encoding
+
+    Returns:
+        Processed image for each device, in the order given. Devices with
+        the same display share one image object.
+
+    Raises:
+        RuntimeError: If a device's capabilities are unknown
+        ProtocolError: If an upload fails. The first error is raised after
+            the uploads still in progress are cancelled.
+
+    Example:
+        async with OpenDisplayDevice(mac_address=mac_a) as a, OpenDisplayDevice(mac_address=mac_b) as b:
+            await upload_to_many([a, b], image)
+    """
+    # One representative device per distinct display does the preparation
+    groups: dict[tuple[int, int, ColorScheme, int | None, bool], OpenDisplayDevice] = {}
+    device_keys = []
+    for device in devices:
+        key = device.display_key
+        groups.setdefault(key, device)
+        device_keys.append(key)
+
+    # Distinct displays are prepared concurrently in worker threads; NumPy and
+    # zlib release the GIL for much of that work
+    results = await asyncio.gather(
+        *(
+            asyncio.to_thread(
+                prepare_image,
+                image,
+                config=device.config,
+                capabilities=device.capabilities,
+                use_measured_palettes=use_measured_palettes,
+                panel_ic_type=panel_ic_type,
+                dither_mode=dither_mode,
+                compress=compress,
+                tone_compression=tone_compression,
+                fit=fit,
+                rotate=rotate,
+            )
+            for (_, _, _, panel_ic_type, use_measured_palettes), device in groups.items()
+        )
+    )
+    prepared = dict(zip(groups, results, strict=True))
+    per_device = [prepared[key] for key in device_keys]
+
+    uploads = [
+        asyncio.create_task(device.upload_prepared_image(data, refresh_mode=refresh_mode, compress=compress))
+        for device, data in zip(devices, per_device, strict=True)
+    ]
+    try:
+        await asyncio.gather(*uploads)
+    except BaseException:
+        # gather() leaves the other transfers running; stop them before raising
+        for upload in uploads:
+            upload.cancel()
+        await asyncio.gather(*uploads, return_exceptions=True)
+        raise
+    return [processed_image for _, _, processed_image in per_device]
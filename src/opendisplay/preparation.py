@@ -0,0 +1,171 @@
+"""Image preparation for upload: rotate, fit, dither, encode and compress."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import zlib
+
+from epaper_dithering import ColorPalette, ColorScheme, DitherMode, dither_image
+from PIL import Image
+
+from .display_palettes import PANELS_4GRAY, get_palette_for_display
+from .encoding import (
+    compress_image_data,
+    encode_bitplanes,
+    encode_image,
+    fit_image,
+)
+from .models.capabilities import DeviceCapabilities
+from .models.config import GlobalConfig
+from .models.enums import FitMode, Rotation
+
+_LOGGER = logging.getLogger(__name__)
+
+# Deflate strategies tried for uploads; RLE wins on some noisy dithered photos
+_COMPRESS_STRATEGIES = (zlib.Z_DEFAULT_STRATEGY, zlib.Z_RLE)
+
+# Clockwise Rotation -> PIL Transpose (PIL rotates counter-clockwise)
+_ROTATION_TRANSPOSE = {
+    Rotation.ROTATE_90: Image.Transpose.ROTATE_270,
+    Rotation.ROTATE_180: Image.Transpose.ROTATE_180,
+    Rotation.ROTATE_270: Image.Transpose.ROTATE_90,
+}
+
+
+def rotate_source_image(image: Image.Image, rotate: Rotation) -> Image.Image:
+    """Rotate source image by enum value before fitting.
+
+    Rotation uses clockwise semantics for API ergonomics.
+    """
+    if not isinstance(rotate, Rotation):
+        raise TypeError(f"rotate must be Rotation, got {type(rotate).__name__}")
+
+    transpose = _ROTATION_TRANSPOSE.get(rotate)
+    if transpose is None:
+        return image
+
+    return image.transpose(transpose)
+
+
+def resolve_palette(
+    panel_ic_type: int | None,
+    color_scheme: ColorScheme,
+    use_measured_palettes: bool,
+) -> ColorScheme | ColorPalette:
+    """Pick the dither palette for a panel, warning about unknown 4-gray panels."""
+    if color_scheme == ColorScheme.GRAYSCALE_4 and panel_ic_type is not None and panel_ic_type not in PANELS_4GRAY:
+        _LOGGER.warning(
+            "Panel IC 0x%04x is not a known 4-gray panel. GRAYSCALE_4 encoding may not display correctly.",
+            panel_ic_type,
+        )
+
+    return get_palette_for_display(panel_ic_type, color_scheme, use_measured_palettes)
+
+
+def image_fingerprint(image: Image.Image) -> bytes:
+    """Digest of an image's pixels (and palette, for paletted modes)."""
+    digest = hashlib.blake2b(image.tobytes(), digest_size=16)
+    if image.mode in ("P", "PA"):
+        digest.update(bytes(image.getpalette() or ()))
+    return digest.digest()
+
+
+def prepare_image(
+    image: Image.Image,
+    config: GlobalConfig | None = None,
+    capabilities: DeviceCapabilities | None = None,
+    use_measured_palettes: bool = True,
+    panel_ic_type: int | None = None,
+    dither_mode: DitherMode = DitherMode.BURKES,
+    compress: bool = True,
+    tone_compression: float | str = "auto",
+    fit: FitMode = FitMode.CONTAIN,
+    rotate: Rotation = Rotation.ROTATE_0,
+    palette: ColorScheme | ColorPalette | None = None,
+) -> tuple[bytes, bytes | None, Image.Image]:
+    """Prepare image for display without requiring a BLE connection.
+
+    Standalone function that processes an image (rotate, fit, dither, encode)
+    using only the device configuration. No device instance or BLE connection
+    needed.
+
+    Args:
+        image: PIL Image to prepare
+        config: Device configuration (GlobalConfig from interrogation)
+        capabilities: Optional explicit capabilities. If None, extracted
+            from config.
+        use_measured_palettes: Use measured color palettes when available
+        panel_ic_type: Panel IC type for palette lookup. If None, extracted
+            from config.
+        dither_mode: Dithering algorithm to use (default: BURKES)
+        compress: Whether to compress the image data (default: True)
+        tone_compression: Dynamic range compression ("auto", or 0.0-1.0)
+        fit: How to map the image to display dimensions (default: CONTAIN)
+        rotate: Source image rotation enum (0/90/180/270)
+        palette: Pre-resolved dither palette. If None, selected from
+            panel_ic_type and the color scheme.
+
+    Returns:
+        Tuple of (uncompressed_data, compressed_data or None, processed_image)
+
+    Raises:
+        RuntimeError: If config has no display information
+    """
+    if capabilities is None:
+        if config is None or not config.displays:
+            raise RuntimeError("Config has no display information")
+        display = config.displays[0]
+        capabilities = DeviceCapabilities(
+            width=display.pixel_width,
+            height=display.pixel_height,
+            color_scheme=ColorScheme.from_value(display.color_scheme),
+            rotation=display.rotation,
+        )
+
+    if panel_ic_type is None and config is not None and config.displays:
+        panel_ic_type = config.displays[0].panel_ic_type
+
+    target_size = (capabilities.width, capabilities.height)
+    image = rotate_source_image(image, rotate)
+
+    if image.size != target_size:
+        # Pillow resizes paletted and 1-bit images with NEAREST; convert first so
+        # the fit resamples properly (dither_image would convert to RGB anyway)
+        if image.mode in ("1", "P", "PA"):
+            has_alpha = image.mode == "PA" or "transparency" in image.info
+            image = image.convert("RGBA" if has_alpha else "RGB")
+        _LOGGER.info(
+            "Fitting image %dx%d -> %dx%d (mode: %s)",
+            image.width,
+            image.height,
+            capabilities.width,
+            capabilities.height,
+            fit.name,
+        )
+        image = fit_image(image, target_size, fit)
+
+    color_scheme = capabilities.color_scheme
+    if palette is None:
+        palette = resolve_palette(panel_ic_type, color_scheme, use_measured_palettes)
+    dithered = dither_image(image, palette, mode=dither_mode, tone_compression=tone_compression)
+
+    # Encode to device format
+    if color_scheme in (ColorScheme.BWR, ColorScheme.BWY):
+        # Both planes are encoded into one buffer, so no concatenation is needed
+        planes = bytearray(2 * ((dithered.width + 7) // 8) * dithered.height)
+        encode_bitplanes(dithered, color_scheme, out=planes)
+        image_data = bytes(planes)
+    else:
+        image_data = encode_image(dithered, color_scheme)
+
+    # Optionally compress, keeping whichever strategy gives the smaller payload:
+    # bytes on the BLE link cost far more than the extra (fast) RLE pass
+    compressed_data = None
+    if compress:
+        compressed_data = min(
+            (compress_image_data(image_data, level=6, strategy=strategy) for strategy in _COMPRESS_STRATEGIES),
+            key=len,
+        )
+
+    return image_data, compressed_data, dithered
@@ -40,6 +40,9 @@ PIPELINE_CHUNKS = 1  # Wait for ACK after each chunk
 MAX_COMPRESSED_SIZE = 50 * 1024  # 50KB - firmware buffer limit for compressed uploads
 MAX_START_PAYLOAD = 200  # Maximum bytes in START command (prevents MTU issues)
 
+# Fixed prefix of every DATA packet, built once instead of per chunk
+DIRECT_WRITE_DATA_HEADER = CommandCode.DIRECT_WRITE_DATA.to_bytes(2, byteorder="big")
+
 
 def build_read_config_command() -> bytes:
     """Build command to read device TLV configuration.
@@ -128,11 +131,12 @@ def build_direct_write_start_uncompressed() -> bytes:
     return CommandCode.DIRECT_WRITE_START.to_bytes(2, byteorder="big")
 
 
-def build_direct_write_data_command(chunk_data: bytes) -> bytes:
+def build_direct_write_data_command(chunk_data: bytes | memoryview) -> bytes:
     """Build command to send image data chunk.
 
     Args:
-        chunk_data: Image data chunk (max CHUNK_SIZE bytes)
+        chunk_data: Image data chunk (max CHUNK_SIZE bytes). A memoryview
+            slice is accepted so callers can chunk without copying.
 
     Returns:
         Command bytes: 0x0071 + chunk_data
@@ -145,8 +149,8 @@ def build_direct_write_data_command(chunk_data: bytes) -> bytes:
     if len(chunk_data) > CHUNK_SIZE:
         raise ValueError(f"Chunk size {len(chunk_data)} exceeds maximum {CHUNK_SIZE}")
 
-    cmd = CommandCode.DIRECT_WRITE_DATA.to_bytes(2, byteorder="big")
-    return cmd + chunk_data
+    # One concatenation: the packet is the only new object per chunk
+    return DIRECT_WRITE_DATA_HEADER + chunk_data
 
 
 def build_direct_write_end_command(refresh_mode: int = 0) -> bytes:
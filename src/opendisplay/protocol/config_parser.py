@@ -37,14 +37,15 @@ WIFI_CONFIG_SIZE = 160
 WIFI_CONFIG_LEGACY_SIZE = 65
 
 
-def parse_config_response(raw_data: bytes) -> GlobalConfig:
+def parse_config_response(raw_data: bytes | bytearray | memoryview) -> GlobalConfig:
     """Parse complete TLV config response from device.
 
     Firmware sends config data with a wrapper: [length:2][version:1][packets...][crc:2]
     This function strips the wrapper and passes clean packet data to the TLV parser.
 
     Args:
-        raw_data: Complete TLV data assembled from all BLE chunks
+        raw_data: Complete TLV data assembled from all BLE chunks. Any
+            bytes-like buffer is accepted; only the packet section is copied.
 
     Returns:
         Parsed GlobalConfig
@@ -65,11 +66,13 @@ def parse_config_response(raw_data: bytes) -> GlobalConfig:
         config_version,
     )
 
-    # Extract packet data (skip 3-byte header, ignore 2-byte CRC at end)
+    # Extract packet data (skip 3-byte header, ignore 2-byte CRC at end) as the
+    # single copy of the buffer; parsed fields slice from immutable bytes
+    view = memoryview(raw_data)
     if len(raw_data) > 5:
-        packet_data = raw_data[3:-2]  # Skip header, ignore CRC
+        packet_data = bytes(view[3:-2])  # Skip header, ignore CRC
     else:
-        packet_data = raw_data[3:]  # Skip header only
+        packet_data = bytes(view[3:])  # Skip header only
 
     _LOGGER.debug("Packet data after wrapper strip: %d bytes", len(packet_data))
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import struct
+import zlib
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -34,8 +35,8 @@ PACKET_TYPE_WIFI_CONFIG = 0x26
 def calculate_config_crc(data: bytes) -> int:
     """Calculate CRC32 and return lower 16 bits.
 
-    Uses standard CRC32 algorithm (same as zlib/firmware) but only returns
-    the lower 16 bits for backwards compatibility with firmware.
+    Uses standard CRC32 algorithm (computed by zlib, same as firmware) but only
+    returns the lower 16 bits for backwards compatibility with firmware.
 
     Firmware source: main.cpp:1543-1556, 1912-1914
     The firmware calculates full CRC32 but only uses lower 16 bits.
@@ -46,18 +47,7 @@ def calculate_config_crc(data: bytes) -> int:
     Returns:
         Lower 16 bits of CRC32 value
     """
-    crc = 0xFFFFFFFF
-
-    for byte in data:
-        crc ^= byte
-        for _ in range(8):
-            if crc & 1:
-                crc = (crc >> 1) ^ 0xEDB88320
-            else:
-                crc = crc >> 1
-
-    crc32 = (~crc) & 0xFFFFFFFF
-    return crc32 & 0xFFFF  # Return lower 16 bits only
+    return zlib.crc32(data) & 0xFFFF  # Return lower 16 bits only
 
 
 def serialize_system_config(config: SystemConfig) -> bytes:
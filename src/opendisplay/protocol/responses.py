@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-import struct
-
 from ..exceptions import InvalidResponseError
 from ..models.firmware import FirmwareVersion
 from .commands import RESPONSE_HIGH_BIT_FLAG, CommandCode
@@ -19,7 +17,7 @@ def unpack_command_code(data: bytes, offset: int = 0) -> int:
     Returns:
         Command code as integer
     """
-    return int(struct.unpack(">H", data[offset : offset + 2])[0])
+    return (data[offset] << 8) | data[offset + 1]
 
 
 def strip_command_echo(data: bytes, expected_cmd: CommandCode) -> bytes:
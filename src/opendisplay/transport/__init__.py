@@ -1,7 +1,9 @@
 """BLE transport layer."""
 
 from .connection import BLEConnection
+from .direct_write import DirectWriteTransfer
 
 __all__ = [
     "BLEConnection",
+    "DirectWriteTransfer",
 ]
@@ -206,6 +206,12 @@ class BLEConnection:
         Raises:
             BLETimeoutError: If no response received within timeout
         """
+        # Responses that already arrived (e.g. pipelined ACKs) need no timer
+        try:
+            return self._notification_queue.get_nowait()
+        except asyncio.QueueEmpty:
+            pass
+
         try:
             return await asyncio.wait_for(
                 self._notification_queue.get(),
@@ -0,0 +1,255 @@
+"""DIRECT_WRITE image transfer over an established BLE connection."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from ..exceptions import BLETimeoutError, ProtocolError
+from ..models.enums import RefreshMode
+from ..protocol import (
+    CHUNK_SIZE,
+    PIPELINE_CHUNKS,
+    CommandCode,
+    build_direct_write_data_command,
+    build_direct_write_end_command,
+    build_direct_write_start_compressed,
+    build_direct_write_start_uncompressed,
+    validate_ack_response,
+)
+from ..protocol.commands import RESPONSE_HIGH_BIT_FLAG
+from ..protocol.responses import unpack_command_code
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .connection import BLEConnection
+
+_LOGGER = logging.getLogger(__name__)
+
+# Plain-int response codes for the per-chunk ACK check (enum member access is slower)
+_CMD_DIRECT_WRITE_DATA = int(CommandCode.DIRECT_WRITE_DATA)
+_CMD_DIRECT_WRITE_END = int(CommandCode.DIRECT_WRITE_END)
+
+# END commands are fixed per refresh mode, so frame them once at import
+_END_COMMANDS = {mode: build_direct_write_end_command(mode.value) for mode in RefreshMode}
+
+
+class DirectWriteTransfer:
+    """Sends encoded image data with the START / DATA / END command sequence.
+
+    Example:
+        transfer = DirectWriteTransfer(connection, ack_timeout=5.0, refresh_timeout=90.0)
+        await transfer.send(image_data, RefreshMode.FULL)
+    """
+
+    def __init__(
+        self,
+        connection: BLEConnection,
+        *,
+        ack_timeout: float,
+        refresh_timeout: float,
+        chunk_size: int = CHUNK_SIZE,
+        pipeline_chunks: int = PIPELINE_CHUNKS,
+    ):
+        """Initialize a transfer.
+
+        Args:
+            connection: Connected BLE connection
+            ack_timeout: Seconds to wait for each command acknowledgment
+            refresh_timeout: Seconds to wait for the END response (display refresh)
+            chunk_size: Image bytes per DATA chunk (firmware accepts at most CHUNK_SIZE)
+            pipeline_chunks: DATA chunks written before waiting for the oldest ACK
+                (1 = stop-and-wait)
+        """
+        self._connection = connection
+        self._ack_timeout = ack_timeout
+        self._refresh_timeout = refresh_timeout
+        self._chunk_size = chunk_size
+        self._pipeline_chunks = pipeline_chunks
+
+    async def send(
+        self,
+        image_data: bytes,
+        refresh_mode: RefreshMode,
+        use_compression: bool = False,
+        compressed_data: bytes | None = None,
+        uncompressed_size: int | None = None,
+        progress_callback: Callable[[int, int], None] | None = None,
+    ) -> None:
+        """Send image data using the compressed or uncompressed protocol.
+
+        Args:
+            image_data: Raw uncompressed image data (always needed for uncompressed)
+            refresh_mode: Display refresh mode
+            use_compression: True to use compressed protocol
+            compressed_data: Compressed data (required if use_compression=True)
+            uncompressed_size: Original size (required if use_compression=True)
+            progress_callback: Optional (bytes_sent, total_bytes) callback per DATA chunk
+
+        Raises:
+            ProtocolError: If upload fails
+        """
+        # 1. Send START command (different for each protocol)
+        if use_compression:
+            assert uncompressed_size is not None and compressed_data is not None
+            start_cmd, remaining_compressed = build_direct_write_start_compressed(uncompressed_size, compressed_data)
+            compressed_size = len(compressed_data)
+        else:
+            start_cmd = build_direct_write_start_uncompressed()
+            remaining_compressed = None
+            compressed_size = 0
+
+        await self._connection.write_command(start_cmd)
+
+        # 2. Wait for START ACK (identical for both protocols)
+        response = await self._connection.read_response(timeout=self._ack_timeout)
+        validate_ack_response(response, CommandCode.DIRECT_WRITE_START)
+
+        # 3. Send data chunks
+        auto_completed = False
+        if use_compression:
+            # Compressed upload: send remaining compressed data as chunks
+            if remaining_compressed:
+                auto_completed = await self.send_data_chunks(
+                    remaining_compressed,
+                    progress_callback,
+                    start_bytes=compressed_size - len(remaining_compressed),
+                )
+            elif progress_callback is not None:
+                # Everything fit in START
+                progress_callback(compressed_size, compressed_size)
+        else:
+            # Uncompressed upload: send raw image data as chunks
+            auto_completed = await self.send_data_chunks(image_data, progress_callback)
+
+        # 4. Send END command if needed (identical for both protocols)
+        if not auto_completed:
+            await self._connection.write_command(_END_COMMANDS[refresh_mode])
+
+            # Wait for END ACK (90s timeout for display refresh)
+            response = await self._connection.read_response(timeout=self._refresh_timeout)
+            validate_ack_response(response, CommandCode.DIRECT_WRITE_END)
+
+    async def send_data_chunks(
+        self,
+        image_data: bytes,
+        progress_callback: Callable[[int, int], None] | None = None,
+        start_bytes: int = 0,
+    ) -> bool:
+        """Send image data chunks with ACK handling.
+
+        Sends image data in chunks via 0x0071 DATA commands. Handles:
+        - Timeout recovery when firmware starts display refresh
+        - Auto-completion detection (firmware sends 0x0072 END early)
+        - Up to pipeline_chunks unacknowledged chunks in flight
+        - Progress reporting via progress_callback
+
+        Args:
+            image_data: Uncompressed encoded image data
+            progress_callback: Optional callable receiving (bytes_sent, total_bytes)
+                after each chunk is written
+            start_bytes: Payload bytes already sent in the START command, counted
+                in the reported progress
+
+        Returns:
+            True if device auto-completed (sent 0x0072 END early)
+            False if all chunks sent normally (caller should send END)
+
+        Raises:
+            ProtocolError: If unexpected response received
+            BLETimeoutError: If no response within timeout
+        """
+        image_view = memoryview(image_data)  # Zero-copy chunk slicing
+        total = len(image_data)
+        chunk_size = self._chunk_size
+        pipeline_depth = max(1, self._pipeline_chunks)
+        write_command = self._connection.write_command
+        bytes_sent = 0
+        chunks_sent = 0
+        chunks_acked = 0
+        auto_completed = False
+
+        for chunk_start in range(0, total, chunk_size):
+            # Get next chunk (slicing past the end clamps the final short chunk)
+            chunk_data = image_view[chunk_start : chunk_start + chunk_size]
+
+            # Send DATA command
+            await write_command(build_direct_write_data_command(chunk_data))
+
+            bytes_sent += len(chunk_data)
+            chunks_sent += 1
+
+            if progress_callback is not None:
+                progress_callback(start_bytes + bytes_sent, start_bytes + total)
+
+            # Keep at most PIPELINE_CHUNKS DATA commands waiting for an ACK
+            if chunks_sent - chunks_acked >= pipeline_depth:
+                chunks_acked += 1
+                if await self._read_data_ack(chunks_acked, total):
+                    auto_completed = True
+                    break
+
+        # Drain ACKs for chunks still in flight
+        while not auto_completed and chunks_acked < chunks_sent:
+            chunks_acked += 1
+            auto_completed = await self._read_data_ack(chunks_acked, total)
+
+        _LOGGER.debug(
+            "Data chunks sent (%d chunks, %d bytes, auto-completed: %s)", chunks_sent, bytes_sent, auto_completed
+        )
+        return auto_completed  # False: normal completion, caller should send END
+
+    async def _read_data_ack(self, chunk_number: int, total: int) -> bool:
+        """Wait for the ACK of one DATA chunk.
+
+        Args:
+            chunk_number: 1-based index of the chunk being acknowledged
+            total: Total number of bytes in the transfer (for progress logging)
+
+        Returns:
+            True if device auto-completed (sent 0x0072 END early)
+            False for a normal DATA ACK (0x0071)
+
+        Raises:
+            ProtocolError: If unexpected response received
+            BLETimeoutError: If no response within timeout
+        """
+        try:
+            response = await self._connection.read_response(timeout=self._ack_timeout)
+        except BLETimeoutError:
+            # Timeout on response - firmware might be doing display refresh
+            # This happens when the chunk completes directWriteTotalBytes
+            _LOGGER.info(
+                "No response after chunk %d (%.1f%%), waiting for device refresh...",
+                chunk_number,
+                min(chunk_number * self._chunk_size, total) / total * 100,
+            )
+
+            # Wait up to 90 seconds for the END response
+            response = await self._connection.read_response(timeout=self._refresh_timeout)
+
+        # Check what response we got (firmware can send 0x0072 on ANY chunk, not just last!)
+        # Compared as a plain int; CommandCode is only built for the error message
+        command = unpack_command_code(response) & ~RESPONSE_HIGH_BIT_FLAG
+
+        if command == _CMD_DIRECT_WRITE_DATA:
+            # Normal DATA ACK (0x0071) - continue sending chunks
+            return False
+        if command == _CMD_DIRECT_WRITE_END:
+            # Firmware auto-triggered END (0x0072) after receiving all data
+            # This happens when last chunk completes directWriteTotalBytes
+            _LOGGER.info(
+                "Received END response after chunk %d - device auto-completed",
+                chunk_number,
+            )
+            # Note: 0x0072 is sent AFTER display refresh completes (waitforrefresh(60))
+            # So we're already done - no need to send our own 0x0072 END command!
+            return True
+
+        # Unexpected response
+        try:
+            name = CommandCode(command).name
+        except ValueError:
+            name = "unknown command"
+        raise ProtocolError(f"Unexpected response: {name} (0x{command:04x})")
@@ -0,0 +1,279 @@
+"""Test chunked config reads and writes via OpenDisplayDevice."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from epaper_dithering import ColorScheme
+
+from opendisplay import OpenDisplayDevice
+from opendisplay.models.config import (
+    DisplayConfig,
+    GlobalConfig,
+    ManufacturerData,
+    PowerOption,
+    SystemConfig,
+)
+from opendisplay.protocol import build_write_config_command, serialize_config
+
+
+class _FakeConnection:
+    def __init__(self, responses: list[bytes]):
+        self._responses = responses[:]
+        self.written: list[bytes] = []
+        self.events: list[str] = []
+
+    async def write_command(self, cmd: bytes) -> None:
+        self.events.append("write")
+        self.written.append(cmd)
+
+    async def read_response(self, timeout: float) -> bytes:
+        self.events.append("read")
+        if not self._responses:
+            raise RuntimeError("No fake responses left")
+        return self._responses.pop(0)
+
+
+def _config() -> GlobalConfig:
+    return GlobalConfig(
+        system=SystemConfig(
+            ic_type=1,
+            communication_modes=1,
+            device_flags=0,
+            pwr_pin=0xFF,
+            reserved=b"\x00" * 17,
+        ),
+        manufacturer=ManufacturerData(
+            manufacturer_id=1,
+            board_type=0,
+            board_revision=1,
+            reserved=b"\x00" * 18,
+        ),
+        power=PowerOption(
+            power_mode=1,
+            battery_capacity_mah=(1000).to_bytes(3, "little"),
+            sleep_timeout_ms=1000,
+            tx_power=0,
+            sleep_flags=0,
+            battery_sense_pin=0xFF,
+            battery_sense_enable_pin=0xFF,
+            battery_sense_flags=0,
+            capacity_estimator=1,
+            voltage_scaling_factor=100,
+            deep_sleep_current_ua=0,
+            deep_sleep_time_seconds=0,
+            reserved=b"\x00" * 10,
+        ),
+        displays=[
+            DisplayConfig(
+                instance_number=0,
+                display_technology=0,
+                panel_ic_type=0,
+                pixel_width=296,
+                pixel_height=128,
+                active_width_mm=66,
+                active_height_mm=29,
+                tag_type=0,
+                rotation=0,
+                reset_pin=0xFF,
+                busy_pin=0xFF,
+                dc_pin=0xFF,
+                cs_pin=0xFF,
+                data_pin=0,
+                partial_update_support=0,
+                color_scheme=ColorScheme.BWR.value,
+                transmission_modes=0,
+                clk_pin=0,
+                reserved_pins=b"\x00" * 7,
+                full_update_mC=0,
+                reserved=b"\x00" * 15,
+            )
+        ],
+    )
+
+
+def _chunk_responses(tlv_data: bytes, chunk_size: int) -> list[bytes]:
+    """Split TLV data into READ_CONFIG notifications as firmware sends them."""
+    echo = b"\x00\x40"
+    first = echo + b"\x00\x00" + len(tlv_data).to_bytes(2, "little") + tlv_data[:chunk_size]
+    responses = [first]
+    for number, start in enumerate(range(chunk_size, len(tlv_data), chunk_size), start=1):
+        responses.append(echo + number.to_bytes(2, "little") + tlv_data[start : start + chunk_size])
+    return responses
+
+
+@pytest.mark.asyncio
+async def test_interrogate_reassembles_multi_chunk_config() -> None:
+    """Chunks should be written back-to-back into one TLV buffer."""
+    tlv_data = serialize_config(_config())
+    device = OpenDisplayDevice(mac_address="AA:BB:CC:DD:EE:FF")
+    fake = _FakeConnection(_chunk_responses(tlv_data, chunk_size=40))
+    device._connection = fake  # Inject fake connection
+
+    config = await device.interrogate()
+
+    assert fake.written == [b"\x00\x40"]
+    assert config.displays[0].pixel_width == 296
+    assert type(config.displays[0].reserved) is bytes
+    assert device.color_scheme == ColorScheme.BWR
+
+
+@pytest.mark.asyncio
+async def test_interrogate_single_chunk_config() -> None:
+    """A config that fits in the first chunk needs no further reads."""
+    tlv_data = serialize_config(_config())
+    device = OpenDisplayDevice(mac_address="AA:BB:CC:DD:EE:FF")
+    fake = _FakeConnection(_chunk_responses(tlv_data, chunk_size=len(tlv_data)))
+    device._connection = fake  # Inject fake connection
+
+    config = await device.interrogate()
+
+    assert config.manufacturer.manufacturer_id == 1
+    assert device.width == 296
+
+
+@pytest.mark.asyncio
+async def test_read_on_connect_pipelines_firmware_and_config() -> None:
+    """Both commands should be written before any response is read."""
+    tlv_data = serialize_config(_config())
+    fw_response = b"\x00\x43\x01\x02\x08" + b"abcdef12"
+    device = OpenDisplayDevice(mac_address="AA:BB:CC:DD:EE:FF", auto_read_firmware=True)
+    fake = _FakeConnection([fw_response, *_chunk_responses(tlv_data, chunk_size=40)])
+    device._connection = fake  # Inject fake connection
+
+    await device._read_on_connect()
+
+    assert fake.written == [b"\x00\x43", b"\x00\x40"]
+    assert device._fw_version == {"major": 1, "minor": 2, "sha": "abcdef12"}
+    assert device.width == 296
+
+
+@pytest.mark.asyncio
+async def test_read_on_connect_skips_firmware_by_default() -> None:
+    """Without auto_read_firmware only the config is read."""
+    tlv_data = serialize_config(_config())
+    device = OpenDisplayDevice(mac_address="AA:BB:CC:DD:EE:FF")
+    fake = _FakeConnection(_chunk_responses(tlv_data, chunk_size=40))
+    device._connection = fake  # Inject fake connection
+
+    await device._read_on_connect()
+
+    assert fake.written == [b"\x00\x40"]
+    assert device._fw_version is None
+
+
+_LARGE_CONFIG_DATA = bytes(range(256)) * 3
+
+
+@pytest.mark.asyncio
+async def test_write_config_waits_for_each_chunk_ack_by_default(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Config chunks are stop-and-wait unless PIPELINE_CHUNKS is raised."""
+    monkeypatch.setattr("opendisplay.device.serialize_config", lambda config: _LARGE_CONFIG_DATA)
+    first_cmd, chunk_cmds = build_write_config_command(_LARGE_CONFIG_DATA)
+    fake = _FakeConnection([b"\x00\x41"] + [b"\x00\x42"] * len(chunk_cmds))
+    device = OpenDisplayDevice(mac_address="AA:BB:CC:DD:EE:FF")
+    device._connection = fake  # Inject fake connection
+
+    await device.write_config(_config())
+
+    assert len(chunk_cmds) == 3
+    assert fake.written == [first_cmd, *chunk_cmds]
+    assert fake.events == ["write", "read"] * 4
+
+
+@pytest.mark.asyncio
+async def test_write_config_pipelines_chunks_within_window(monkeypatch: pytest.MonkeyPatch) -> None:
+    """With PIPELINE_CHUNKS > 1, chunk writes run ahead of their ACKs."""
+    monkeypatch.setattr("opendisplay.device.serialize_config", lambda config: _LARGE_CONFIG_DATA)
+    first_cmd, chunk_cmds = build_write_config_command(_LARGE_CONFIG_DATA)
+    fake = _FakeConnection([b"\x00\x41"] + [b"\x00\x42"] * len(chunk_cmds))
+    device = OpenDisplayDevice(mac_address="AA:BB:CC:DD:EE:FF")
+    device._connection = fake  # Inject fake connection
+    device.PIPELINE_CHUNKS = 2
+
+    await device.write_config(_config())
+
+    assert fake.written == [first_cmd, *chunk_cmds]
+    assert fake.events == ["write", "read", "write", "write", "read", "write", "read", "read"]
+
+
+_FW_RESPONSE = b"\x00\x43\x01\x02\x08" + b"abcdef12"
+
+
+@pytest.mark.asyncio
+async def test_read_on_connect_caches_interrogated_config(tmp_path: Path) -> None:
+    """With a cache_dir, a later connect needs only the firmware version read."""
+    tlv_data = serialize_config(_config())
+    device = OpenDisplayDevice(mac_address="AA:BB:CC:DD:EE:FF", cache_dir=tmp_path)
+    first = _FakeConnection([_FW_RESPONSE, *_chunk_responses(tlv_data, chunk_size=len(tlv_data))])
+    device._connection = first  # Inject fake connection
+
+    await device._read_on_connect()
+
+    # Without auto_read_firmware the version read is not pipelined with READ_CONFIG
+    assert first.events == ["write", "read", "write", "read"]
+    assert (tmp_path / "AABBCCDDEEFF.json").exists()
+
+    reconnected = OpenDisplayDevice(mac_address="AA:BB:CC:DD:EE:FF", cache_dir=tmp_path)
+    fake = _FakeConnection([_FW_RESPONSE])
+    reconnected._connection = fake  # Inject fake connection
+
+    await reconnected._read_on_connect()
+
+    assert fake.written == [b"\x00\x43"]
+    assert reconnected.config == device.config
+
+
+@pytest.mark.asyncio
+async def test_read_on_connect_reinterrogates_after_firmware_change(tmp_path: Path) -> None:
+    """A cached config stored under another firmware SHA is not used."""
+    tlv_data = serialize_config(_config())
+    device = OpenDisplayDevice(mac_address="AA:BB:CC:DD:EE:FF", cache_dir=tmp_path)
+    device._connection = _FakeConnection(
+        [_FW_RESPONSE, *_chunk_responses(tlv_data, chunk_size=40)]
+    )  # Inject fake connection
+    await device._read_on_connect()
+
+    updated_fw = b"\x00\x43\x01\x03\x08" + b"12345678"
+    reconnected = OpenDisplayDevice(mac_address="AA:BB:CC:DD:EE:FF", cache_dir=tmp_path)
+    fake = _FakeConnection([updated_fw, *_chunk_responses(tlv_data, chunk_size=40)])
+    reconnected._connection = fake  # Inject fake connection
+
+    await reconnected._read_on_connect()
+
+    assert fake.written == [b"\x00\x43", b"\x00\x40"]
+    assert reconnected.width == 296
+    assert '"fw_sha": "12345678"' in (tmp_path / "AABBCCDDEEFF.json").read_text()
+
+
+@pytest.mark.asyncio
+async def test_read_on_connect_discards_corrupt_cache(tmp_path: Path) -> None:
+    """A cache entry that no longer parses is deleted and the device re-interrogated."""
+    cache_file = tmp_path / "AABBCCDDEEFF.json"
+    cache_file.write_text('{"mac_address": "AA:BB:CC:DD:EE:FF", "fw_sha": "abcdef12", "tlv": "0102"}')
+    tlv_data = serialize_config(_config())
+    device = OpenDisplayDevice(mac_address="AA:BB:CC:DD:EE:FF", cache_dir=tmp_path)
+    fake = _FakeConnection([_FW_RESPONSE, *_chunk_responses(tlv_data, chunk_size=40)])
+    device._connection = fake  # Inject fake connection
+
+    await device._read_on_connect()
+
+    assert fake.written == [b"\x00\x43", b"\x00\x40"]
+    assert device.width == 296
+    assert '"tlv": "0102"' not in cache_file.read_text()
+
+
+@pytest.mark.asyncio
+async def test_write_config_survives_unremovable_cache(tmp_path: Path) -> None:
+    """A cache entry that cannot be deleted does not fail a successful write."""
+    (tmp_path / "AABBCCDDEEFF.json").mkdir()  # unlink() raises IsADirectoryError
+    tlv_data = serialize_config(_config())
+    _, chunk_cmds = build_write_config_command(tlv_data)
+    fake = _FakeConnection([b"\x00\x41"] + [b"\x00\x42"] * len(chunk_cmds))
+    device = OpenDisplayDevice(mac_address="AA:BB:CC:DD:EE:FF", cache_dir=tmp_path)
+    device._connection = fake  # Inject fake connection
+
+    await device.write_config(_config())
+
+    assert (tmp_path / "AABBCCDDEEFF.json").is_dir()
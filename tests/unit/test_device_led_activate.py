@@ -97,3 +97,17 @@ async def test_activate_led_blocks_legacy_firmware_before_sending_command() -> N
 
     # Should only have sent READ_FW_VERSION (0x0043), not LED_ACTIVATE (0x0073)
     assert fake.written == [b"\x00\x43"]
+
+
+@pytest.mark.asyncio
+async def test_activate_led_reads_firmware_version_once() -> None:
+    """The firmware gate should be decided once, not re-checked on every call."""
+    device = OpenDisplayDevice(mac_address="AA:BB:CC:DD:EE:FF")
+    fake = _FakeConnection(response=[b"\x00\x43\x01\x00\x07f378685", b"\x00\x73\x00\x00", b"\x00\x73\x00\x00"])
+    device._connection = fake  # Inject fake connection
+    flash_config = LedFlashConfig.single(color=0xE0)
+
+    await device.activate_led(led_instance=0, flash_config=flash_config)
+    await device.activate_led(led_instance=0, flash_config=flash_config)
+
+    assert [cmd[:2] for cmd in fake.written] == [b"\x00\x43", b"\x00\x73", b"\x00\x73"]
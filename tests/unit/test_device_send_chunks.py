@@ -0,0 +1,207 @@
+"""Test DATA chunk streaming in DirectWriteTransfer and OpenDisplayDevice._execute_upload()."""
+
+from __future__ import annotations
+
+import pytest
+
+from opendisplay import OpenDisplayDevice
+from opendisplay.exceptions import ProtocolError
+from opendisplay.models.enums import RefreshMode
+from opendisplay.protocol import CHUNK_SIZE
+from opendisplay.transport import DirectWriteTransfer
+
+DATA_ACK = b"\x00\x71"
+END_ACK = b"\x00\x72"
+
+
+class _FakeConnection:
+    def __init__(self, responses: list[bytes]):
+        self._responses = responses[:]
+        self.events: list[str] = []
+        self.written: list[bytes] = []
+
+    async def write_command(self, cmd: bytes) -> None:
+        self.events.append("write")
+        self.written.append(cmd)
+
+    async def read_response(self, timeout: float) -> bytes:
+        self.events.append("read")
+        if not self._responses:
+            raise RuntimeError("No fake responses left")
+        return self._responses.pop(0)
+
+
+def _device(fake: _FakeConnection) -> OpenDisplayDevice:
+    device = OpenDisplayDevice(mac_address="AA:BB:CC:DD:EE:FF")
+    device._connection = fake  # Inject fake connection
+    return device
+
+
+def _transfer(fake: _FakeConnection, **kwargs: int) -> DirectWriteTransfer:
+    return DirectWriteTransfer(fake, ack_timeout=5.0, refresh_timeout=90.0, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_send_data_chunks_stop_and_wait() -> None:
+    """Default pipeline depth waits for an ACK after every chunk."""
+    data = bytes(range(256)) * 2  # 512 bytes -> 3 chunks
+    fake = _FakeConnection([DATA_ACK] * 3)
+
+    auto_completed = await _transfer(fake).send_data_chunks(data)
+
+    assert auto_completed is False
+    assert fake.events == ["write", "read"] * 3
+    assert b"".join(cmd[2:] for cmd in fake.written) == data
+    assert all(cmd[:2] == b"\x00\x71" for cmd in fake.written)
+    assert len(fake.written[0]) == 2 + CHUNK_SIZE
+
+
+@pytest.mark.asyncio
+async def test_send_data_chunks_pipelines_writes() -> None:
+    """With PIPELINE_CHUNKS > 1, writes run ahead of ACK reads."""
+    data = b"\xaa" * (CHUNK_SIZE * 3 + 1)  # 4 chunks
+    fake = _FakeConnection([DATA_ACK] * 4)
+
+    auto_completed = await _transfer(fake, pipeline_chunks=2).send_data_chunks(data)
+
+    assert auto_completed is False
+    assert fake.events == ["write", "write", "read", "write", "read", "write", "read", "read"]
+    assert b"".join(cmd[2:] for cmd in fake.written) == data
+
+
+@pytest.mark.asyncio
+async def test_send_data_chunks_honours_smaller_chunk_size() -> None:
+    """A device-level CHUNK_SIZE below the protocol maximum splits data finer."""
+    data = bytes(range(100))
+    fake = _FakeConnection([DATA_ACK] * 5)
+
+    await _transfer(fake, chunk_size=20).send_data_chunks(data)
+
+    assert [len(cmd) for cmd in fake.written] == [2 + 20] * 5
+    assert b"".join(cmd[2:] for cmd in fake.written) == data
+
+
+@pytest.mark.asyncio
+async def test_send_data_chunks_detects_auto_complete() -> None:
+    """An END response in place of a DATA ACK finishes the transfer early."""
+    data = b"\x00" * (CHUNK_SIZE * 2)
+    fake = _FakeConnection([DATA_ACK, END_ACK])
+
+    assert await _transfer(fake).send_data_chunks(data) is True
+
+
+@pytest.mark.asyncio
+async def test_send_data_chunks_rejects_unexpected_response() -> None:
+    """Responses other than DATA/END ACKs are protocol errors."""
+    fake = _FakeConnection([b"\x00\x40"])
+
+    with pytest.raises(ProtocolError, match="Unexpected response"):
+        await _transfer(fake).send_data_chunks(b"\x01" * 10)
+
+
+@pytest.mark.asyncio
+async def test_send_data_chunks_accepts_high_bit_ack() -> None:
+    """DATA ACKs with the response high bit set are normal ACKs."""
+    fake = _FakeConnection([b"\x80\x71"])
+
+    assert await _transfer(fake).send_data_chunks(b"\x01" * 10) is False
+
+
+@pytest.mark.asyncio
+async def test_send_data_chunks_rejects_unknown_response_code() -> None:
+    """Codes outside CommandCode are reported as protocol errors."""
+    fake = _FakeConnection([b"\x12\x34"])
+
+    with pytest.raises(ProtocolError, match="unknown command \\(0x1234\\)"):
+        await _transfer(fake).send_data_chunks(b"\x01" * 10)
+
+
+@pytest.mark.asyncio
+async def test_send_data_chunks_reports_progress() -> None:
+    """progress_callback receives cumulative bytes after each chunk."""
+    data = b"\x55" * (CHUNK_SIZE * 2 + 10)
+    fake = _FakeConnection([DATA_ACK] * 3)
+    progress: list[tuple[int, int]] = []
+
+    await _transfer(fake).send_data_chunks(data, lambda sent, total: progress.append((sent, total)))
+
+    assert progress == [(CHUNK_SIZE, len(data)), (CHUNK_SIZE * 2, len(data)), (len(data), len(data))]
+
+
+@pytest.mark.asyncio
+async def test_send_data_chunks_reports_final_progress_on_auto_complete() -> None:
+    """An END ACK on the last chunk still reports the completed transfer."""
+    data = b"\x55" * (CHUNK_SIZE + 10)
+    fake = _FakeConnection([DATA_ACK, END_ACK])
+    progress: list[tuple[int, int]] = []
+
+    auto_completed = await _transfer(fake).send_data_chunks(data, lambda sent, total: progress.append((sent, total)))
+
+    assert auto_completed is True
+    assert progress == [(CHUNK_SIZE, len(data)), (len(data), len(data))]
+
+
+@pytest.mark.asyncio
+async def test_execute_upload_progress_counts_start_payload(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Compressed progress totals include the bytes carried by START."""
+    compressed = b"\x11" * 300
+    monkeypatch.setattr(
+        "opendisplay.transport.direct_write.build_direct_write_start_compressed",
+        lambda size, data: (b"\x00\x70" + data[:100], data[100:]),
+    )
+    fake = _FakeConnection([b"\x00\x70", DATA_ACK, END_ACK])
+    progress: list[tuple[int, int]] = []
+
+    await _device(fake)._execute_upload(
+        b"",
+        RefreshMode.FULL,
+        use_compression=True,
+        compressed_data=compressed,
+        uncompressed_size=1000,
+        progress_callback=lambda sent, total: progress.append((sent, total)),
+    )
+
+    assert progress == [(300, 300)]
+
+
+@pytest.mark.asyncio
+async def test_execute_upload_reports_progress_when_start_holds_everything() -> None:
+    """A compressed payload that fits in START reports one completed call."""
+    compressed = b"\x11" * 20
+    fake = _FakeConnection([b"\x00\x70", END_ACK])
+    progress: list[tuple[int, int]] = []
+
+    await _device(fake)._execute_upload(
+        b"",
+        RefreshMode.FULL,
+        use_compression=True,
+        compressed_data=compressed,
+        uncompressed_size=1000,
+        progress_callback=lambda sent, total: progress.append((sent, total)),
+    )
+
+    assert progress == [(20, 20)]
+    assert len(fake.written) == 2
+
+
+@pytest.mark.asyncio
+async def test_execute_upload_sends_end_with_refresh_mode() -> None:
+    """After all DATA ACKs, END carries the requested refresh mode."""
+    fake = _FakeConnection([b"\x00\x70", DATA_ACK, END_ACK])
+
+    await _device(fake)._execute_upload(b"\x01" * 10, RefreshMode.FAST)
+
+    assert fake.written[0] == b"\x00\x70"
+    assert fake.written[-1] == b"\x00\x72\x01"
+
+
+@pytest.mark.asyncio
+async def test_execute_upload_uses_device_chunk_size() -> None:
+    """A device-level CHUNK_SIZE reaches the DATA chunk transfer."""
+    fake = _FakeConnection([b"\x00\x70", *[DATA_ACK] * 5, END_ACK])
+    device = _device(fake)
+    device.CHUNK_SIZE = 20
+
+    await device._execute_upload(bytes(range(100)), RefreshMode.FULL)
+
+    assert [len(cmd) for cmd in fake.written[1:-1]] == [2 + 20] * 5
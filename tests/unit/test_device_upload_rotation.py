@@ -1,13 +1,17 @@
-"""Test upload image source-rotation behavior."""
+"""Test upload image preparation: source rotation, caching, threading, fan-out."""
 
 from __future__ import annotations
 
+import asyncio
+import threading
+
 import pytest
 from epaper_dithering import ColorScheme, DitherMode
 from PIL import Image
 
-from opendisplay import prepare_image
-from opendisplay.device import _rotate_source_image
+from opendisplay import OpenDisplayDevice, prepare_image, upload_to_many
+from opendisplay.exceptions import ProtocolError
+from opendisplay.models.capabilities import DeviceCapabilities
 from opendisplay.models.config import (
     DisplayConfig,
     GlobalConfig,
@@ -16,6 +20,7 @@ from opendisplay.models.config import (
     SystemConfig,
 )
 from opendisplay.models.enums import FitMode, Rotation
+from opendisplay.preparation import rotate_source_image
 
 
 def _config(width: int = 2, height: int = 2) -> GlobalConfig:
@@ -78,15 +83,15 @@ def _config(width: int = 2, height: int = 2) -> GlobalConfig:
 
 def _stub_prepare_pipeline(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(
-        "opendisplay.device.get_palette_for_display",
+        "opendisplay.preparation.get_palette_for_display",
         lambda panel_ic_type, color_scheme, use_measured_palettes: None,
     )
     monkeypatch.setattr(
-        "opendisplay.device.dither_image",
+        "opendisplay.preparation.dither_image",
         lambda image, palette, mode, tone_compression: image.convert("P"),
     )
     monkeypatch.setattr(
-        "opendisplay.device.encode_image",
+        "opendisplay.preparation.encode_image",
         lambda image, color_scheme: b"\x01\x02",
     )
 
@@ -96,7 +101,7 @@ def test_rotate_source_image_requires_rotation_enum() -> None:
     image = Image.new("RGB", (2, 1), (255, 255, 255))
 
     with pytest.raises(TypeError, match="rotate must be Rotation"):
-        _rotate_source_image(image, 90)  # type: ignore[arg-type]
+        rotate_source_image(image, 90)  # type: ignore[arg-type]
 
 
 def test_rotate_source_image_uses_clockwise_semantics() -> None:
@@ -107,7 +112,7 @@ def test_rotate_source_image_uses_clockwise_semantics() -> None:
     image.putpixel((0, 1), (0, 0, 255))  # C
     image.putpixel((1, 1), (255, 255, 0))  # D
 
-    rotated_90 = _rotate_source_image(image, Rotation.ROTATE_90)
+    rotated_90 = rotate_source_image(image, Rotation.ROTATE_90)
     assert [rotated_90.getpixel((x, y)) for y in range(2) for x in range(2)] == [
         (0, 0, 255),  # C
         (255, 0, 0),  # A
@@ -115,7 +120,7 @@ def test_rotate_source_image_uses_clockwise_semantics() -> None:
         (0, 255, 0),  # B
     ]
 
-    rotated_270 = _rotate_source_image(image, Rotation.ROTATE_270)
+    rotated_270 = rotate_source_image(image, Rotation.ROTATE_270)
     assert [rotated_270.getpixel((x, y)) for y in range(2) for x in range(2)] == [
         (0, 255, 0),  # B
         (255, 255, 0),  # D
@@ -134,7 +139,7 @@ def test_prepare_image_rotates_before_fit(monkeypatch: pytest.MonkeyPatch) -> No
         seen["size_before_fit"] = image.size
         return image.resize(target_size)
 
-    monkeypatch.setattr("opendisplay.device.fit_image", fake_fit_image)
+    monkeypatch.setattr("opendisplay.preparation.fit_image", fake_fit_image)
 
     image = Image.new("RGB", (4, 2), (255, 255, 255))
     encoded, compressed, processed = prepare_image(
@@ -164,7 +169,7 @@ def test_prepare_image_without_rotation_preserves_orientation_before_fit(
         seen["size_before_fit"] = image.size
         return image.resize(target_size)
 
-    monkeypatch.setattr("opendisplay.device.fit_image", fake_fit_image)
+    monkeypatch.setattr("opendisplay.preparation.fit_image", fake_fit_image)
 
     image = Image.new("RGB", (4, 2), (255, 255, 255))
     prepare_image(
@@ -177,3 +182,246 @@ def test_prepare_image_without_rotation_preserves_orientation_before_fit(
     )
 
     assert seen["size_before_fit"] == (4, 2)
+
+
+@pytest.mark.parametrize(
+    ("source", "expected_mode"),
+    [
+        (Image.new("P", (4, 2)), "RGB"),
+        (Image.new("1", (4, 2)), "RGB"),
+        (Image.new("PA", (4, 2)), "RGBA"),
+        (Image.new("L", (4, 2)), "L"),
+    ],
+)
+def test_prepare_image_converts_paletted_sources_before_fit(
+    monkeypatch: pytest.MonkeyPatch, source: Image.Image, expected_mode: str
+) -> None:
+    """Paletted/1-bit sources are converted so the fit can interpolate; others pass through."""
+    _stub_prepare_pipeline(monkeypatch)
+    seen: dict[str, str] = {}
+
+    def fake_fit_image(image: Image.Image, target_size: tuple[int, int], fit: FitMode) -> Image.Image:
+        seen["mode"] = image.mode
+        return image.resize(target_size)
+
+    monkeypatch.setattr("opendisplay.preparation.fit_image", fake_fit_image)
+
+    prepare_image(source, config=_config(width=2, height=2), compress=False)
+
+    assert seen["mode"] == expected_mode
+
+
+def test_device_prepare_image_resolves_palette_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The dither palette should be looked up on the first upload only."""
+    _stub_prepare_pipeline(monkeypatch)
+    lookups: list[int | None] = []
+
+    def fake_get_palette(panel_ic_type, color_scheme, use_measured_palettes):
+        lookups.append(panel_ic_type)
+        return color_scheme
+
+    monkeypatch.setattr("opendisplay.preparation.get_palette_for_display", fake_get_palette)
+
+    device = OpenDisplayDevice(
+        mac_address="AA:BB:CC:DD:EE:FF",
+        config=_config(width=2, height=2),
+        capabilities=DeviceCapabilities(width=2, height=2, color_scheme=ColorScheme.MONO),
+    )
+    image = Image.new("RGB", (2, 2), (255, 255, 255))
+    for _ in range(2):
+        device._prepare_image(image, dither_mode=DitherMode.BURKES, compress=False)
+
+    assert lookups == [0]
+
+
+def test_device_prepare_image_reuses_result_for_unchanged_image(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Identical pixels and options should skip dithering; changed pixels should not."""
+    _stub_prepare_pipeline(monkeypatch)
+    dithered: list[Image.Image] = []
+
+    def fake_dither(image, palette, mode, tone_compression):
+        dithered.append(image)
+        return image.convert("P")
+
+    monkeypatch.setattr("opendisplay.preparation.dither_image", fake_dither)
+
+    device = OpenDisplayDevice(
+        mac_address="AA:BB:CC:DD:EE:FF",
+        capabilities=DeviceCapabilities(width=2, height=2, color_scheme=ColorScheme.MONO),
+    )
+    white = Image.new("RGB", (2, 2), (255, 255, 255))
+    black = Image.new("RGB", (2, 2), (0, 0, 0))
+
+    first = device._prepare_image(white, dither_mode=DitherMode.BURKES, compress=False)
+    again = device._prepare_image(white.copy(), dither_mode=DitherMode.BURKES, compress=False)
+    device._prepare_image(white, dither_mode=DitherMode.ORDERED, compress=False)
+    device._prepare_image(black, dither_mode=DitherMode.BURKES, compress=False)
+
+    assert again[:2] == first[:2]
+    assert len(dithered) == 3
+
+
+def test_device_prepare_image_returns_private_image_copies(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Editing one returned image must not change what later cache hits return."""
+    _stub_prepare_pipeline(monkeypatch)
+    device = OpenDisplayDevice(
+        mac_address="AA:BB:CC:DD:EE:FF",
+        capabilities=DeviceCapabilities(width=2, height=2, color_scheme=ColorScheme.MONO),
+    )
+    image = Image.new("L", (2, 2), 255)
+
+    first = device._prepare_image(image, dither_mode=DitherMode.BURKES, compress=False)
+    first[2].putpixel((0, 0), 0)
+    again = device._prepare_image(image, dither_mode=DitherMode.BURKES, compress=False)
+
+    assert again[2] is not first[2]
+    assert again[2].getpixel((0, 0)) != 0
+
+
+def test_device_prepare_image_cache_keys_on_transparency(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Paletted images differing only in their transparency index are prepared separately."""
+    _stub_prepare_pipeline(monkeypatch)
+    modes: list[str] = []
+
+    def fake_fit_image(image: Image.Image, target_size: tuple[int, int], fit: FitMode) -> Image.Image:
+        modes.append(image.mode)
+        return image.resize(target_size)
+
+    monkeypatch.setattr("opendisplay.preparation.fit_image", fake_fit_image)
+    device = OpenDisplayDevice(
+        mac_address="AA:BB:CC:DD:EE:FF",
+        capabilities=DeviceCapabilities(width=2, height=2, color_scheme=ColorScheme.MONO),
+    )
+    opaque = Image.new("P", (4, 4), 1)
+    keyed = opaque.copy()
+    keyed.info["transparency"] = 1
+
+    device._prepare_image(opaque, dither_mode=DitherMode.BURKES, compress=False)
+    device._prepare_image(keyed, dither_mode=DitherMode.BURKES, compress=False)
+
+    assert modes == ["RGB", "RGBA"]
+
+
+def test_device_prepared_cache_is_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Only the most recent PREPARED_CACHE_SIZE results are kept."""
+    _stub_prepare_pipeline(monkeypatch)
+    device = OpenDisplayDevice(
+        mac_address="AA:BB:CC:DD:EE:FF",
+        capabilities=DeviceCapabilities(width=2, height=2, color_scheme=ColorScheme.MONO),
+    )
+    device.PREPARED_CACHE_SIZE = 2
+
+    for shade in range(3):
+        device._prepare_image(Image.new("L", (2, 2), shade), dither_mode=DitherMode.BURKES, compress=False)
+
+    assert len(device._prepared_cache) == 2
+
+
+@pytest.mark.asyncio
+async def test_upload_image_prepares_off_event_loop_thread(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Image preparation should run in a worker thread, not on the event loop."""
+    device = OpenDisplayDevice(
+        mac_address="AA:BB:CC:DD:EE:FF",
+        capabilities=DeviceCapabilities(width=2, height=2, color_scheme=ColorScheme.MONO),
+    )
+    image = Image.new("RGB", (2, 2), (255, 255, 255))
+    threads: dict[str, int] = {}
+
+    def fake_prepare(*args: object) -> tuple[bytes, bytes | None, Image.Image]:
+        threads["prepare"] = threading.get_ident()
+        return b"\x00", None, image
+
+    async def fake_execute_upload(*args: object, **kwargs: object) -> None:
+        threads["upload"] = threading.get_ident()
+
+    monkeypatch.setattr(device, "_prepare_image", fake_prepare)
+    monkeypatch.setattr(device, "_execute_upload", fake_execute_upload)
+
+    assert await device.upload_image(image, compress=False) is image
+    assert threads["prepare"] != threads["upload"] == threading.get_ident()
+
+
+def test_display_key_separates_palette_choice() -> None:
+    """Devices only share a display key when they would prepare identical data."""
+    capabilities = DeviceCapabilities(width=2, height=2, color_scheme=ColorScheme.BWR)
+    measured = OpenDisplayDevice(mac_address="A", capabilities=capabilities)
+    same = OpenDisplayDevice(mac_address="B", capabilities=capabilities)
+    theoretical = OpenDisplayDevice(mac_address="C", capabilities=capabilities, use_measured_palettes=False)
+
+    assert measured.display_key == same.display_key == (2, 2, ColorScheme.BWR, None, True)
+    assert theoretical.display_key != measured.display_key
+
+
+@pytest.mark.asyncio
+async def test_upload_to_many_prepares_once_per_display_type(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Devices with identical displays share one prepared image; others get their own."""
+    image = Image.new("RGB", (2, 2), (255, 255, 255))
+    prepared: list[ColorScheme] = []
+    uploaded: list[tuple[str, bytes]] = []
+
+    def fake_prepare(source: Image.Image, **kwargs: object) -> tuple[bytes, bytes | None, Image.Image]:
+        capabilities = kwargs["capabilities"]
+        assert isinstance(capabilities, DeviceCapabilities)
+        prepared.append(capabilities.color_scheme)
+        return capabilities.color_scheme.name.encode(), None, image
+
+    monkeypatch.setattr("opendisplay.multi_upload.prepare_image", fake_prepare)
+
+    def make_device(name: str, color_scheme: ColorScheme) -> OpenDisplayDevice:
+        device = OpenDisplayDevice(
+            mac_address=name,
+            capabilities=DeviceCapabilities(width=2, height=2, color_scheme=color_scheme),
+        )
+
+        async def fake_upload(data: tuple[bytes, bytes | None, Image.Image], **kwargs: object) -> None:
+            uploaded.append((name, data[0]))
+
+        monkeypatch.setattr(device, "upload_prepared_image", fake_upload)
+        return device
+
+    devices = [
+        make_device("A", ColorScheme.MONO),
+        make_device("B", ColorScheme.MONO),
+        make_device("C", ColorScheme.BWR),
+    ]
+
+    results = await upload_to_many(devices, image, compress=False)
+
+    assert sorted(prepared, key=lambda scheme: scheme.name) == [ColorScheme.BWR, ColorScheme.MONO]
+    assert sorted(uploaded) == [("A", b"MONO"), ("B", b"MONO"), ("C", b"BWR")]
+    assert results == [image, image, image]
+
+
+@pytest.mark.asyncio
+async def test_upload_to_many_cancels_remaining_uploads_on_failure(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The first failure is raised only after the other transfers are stopped."""
+    image = Image.new("RGB", (2, 2), (255, 255, 255))
+    cancelled: list[str] = []
+    monkeypatch.setattr("opendisplay.multi_upload.prepare_image", lambda *args, **kwargs: (b"\x00", None, image))
+
+    def make_device(name: str, color_scheme: ColorScheme) -> OpenDisplayDevice:
+        return OpenDisplayDevice(
+            mac_address=name,
+            capabilities=DeviceCapabilities(width=2, height=2, color_scheme=color_scheme),
+        )
+
+    failing = make_device("A", ColorScheme.MONO)
+    slow = make_device("B", ColorScheme.BWR)
+
+    async def fail_upload(data: object, **kwargs: object) -> None:
+        raise ProtocolError("upload failed")
+
+    async def slow_upload(data: object, **kwargs: object) -> None:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append("B")
+            raise
+
+    monkeypatch.setattr(failing, "upload_prepared_image", fail_upload)
+    monkeypatch.setattr(slow, "upload_prepared_image", slow_upload)
+
+    with pytest.raises(ProtocolError, match="upload failed"):
+        await upload_to_many([failing, slow], image, compress=False)
+
+    assert cancelled == ["B"]
@@ -0,0 +1,114 @@
+"""Test name-based device lookup."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from opendisplay import discovery
+from opendisplay.discovery import find_device_by_name
+from opendisplay.protocol import MANUFACTURER_ID
+
+
+def _advert(address: str, name: str | None, manufacturer_id: int = MANUFACTURER_ID):
+    device = SimpleNamespace(address=address, name=name)
+    adv_data = SimpleNamespace(manufacturer_data={manufacturer_id: b"\x00"})
+    return device, adv_data
+
+
+@pytest.fixture
+def scans() -> list[float]:
+    """Timeouts of the scans started by find_device_by_filter, one per scan."""
+    return []
+
+
+@pytest.fixture
+def scanned(monkeypatch: pytest.MonkeyPatch, scans: list[float]) -> list[tuple[SimpleNamespace, SimpleNamespace]]:
+    """Advertisements fed, in order, to BleakScanner.find_device_by_filter."""
+    adverts: list[tuple[SimpleNamespace, SimpleNamespace]] = []
+
+    async def fake_find_device_by_filter(filterfunc, timeout):
+        scans.append(timeout)
+        await asyncio.sleep(0)
+        for device, adv_data in adverts:
+            if filterfunc(device, adv_data):
+                return device
+        return None
+
+    monkeypatch.setattr("opendisplay.discovery.BleakScanner.find_device_by_filter", fake_find_device_by_filter)
+    monkeypatch.setattr(discovery, "_SHARED_SEEN", {})
+    return adverts
+
+
+@pytest.mark.asyncio
+async def test_find_device_by_name_returns_first_match(scanned) -> None:
+    """Scanning should stop at the first advertisement with the requested name."""
+    scanned.extend(
+        [
+            _advert("11:22:33:44:55:66", "OpenDisplay-A123", manufacturer_id=0x1234),
+            _advert("AA:BB:CC:DD:EE:FF", "OpenDisplay-A123"),
+            _advert("AA:BB:CC:DD:00:11", "OpenDisplay-A123"),
+        ]
+    )
+
+    found = await find_device_by_name("OpenDisplay-A123")
+
+    assert found is not None
+    assert found.address == "AA:BB:CC:DD:EE:FF"
+
+
+@pytest.mark.asyncio
+async def test_find_device_by_name_matches_discovery_fallback_names(scanned) -> None:
+    """Unnamed and duplicate devices are matched by their discover_devices() names."""
+    scanned.extend([_advert("AA:BB:CC:DD:EE:FF", None), _advert("AA:BB:CC:DD:00:11", "Tag")])
+
+    unnamed = await find_device_by_name("Unknown_EEFF")
+    duplicate = await find_device_by_name("Tag_0011")
+    missing = await find_device_by_name("Other")
+
+    assert unnamed is not None and unnamed.address == "AA:BB:CC:DD:EE:FF"
+    assert duplicate is not None and duplicate.address == "AA:BB:CC:DD:00:11"
+    assert missing is None
+
+
+@pytest.mark.asyncio
+async def test_shared_lookups_reuse_one_scan(scanned, scans) -> None:
+    """Concurrent shared lookups queue on one scan and reuse what it saw."""
+    scanned.extend([_advert("AA:BB:CC:DD:00:11", "Tag-A"), _advert("AA:BB:CC:DD:EE:FF", "Tag-B")])
+
+    found_b, found_a = await asyncio.gather(
+        find_device_by_name("Tag-B", shared=True),
+        find_device_by_name("Tag-A", shared=True),
+    )
+
+    assert found_a is not None and found_a.address == "AA:BB:CC:DD:00:11"
+    assert found_b is not None and found_b.address == "AA:BB:CC:DD:EE:FF"
+    assert len(scans) == 1
+
+
+@pytest.mark.asyncio
+async def test_shared_lookup_rescans_after_ttl(scanned, scans, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Sightings older than SHARED_SCAN_TTL are not reused."""
+    scanned.append(_advert("AA:BB:CC:DD:EE:FF", "Tag"))
+
+    await find_device_by_name("Tag", shared=True)
+    await find_device_by_name("Tag", shared=True)
+    monkeypatch.setattr(discovery, "SHARED_SCAN_TTL", -1.0)
+    await find_device_by_name("Tag", shared=True)
+
+    assert len(scans) == 2
+
+
+@pytest.mark.asyncio
+async def test_shared_scan_prunes_expired_sightings(scanned, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Recording a sighting drops entries older than SHARED_SCAN_TTL."""
+    scanned.append(_advert("AA:BB:CC:DD:00:11", "Tag-A"))
+    await find_device_by_name("Tag-A", shared=True)
+
+    scanned[:] = [_advert("AA:BB:CC:DD:EE:FF", "Tag-B")]
+    monkeypatch.setattr(discovery, "SHARED_SCAN_TTL", -1.0)
+    await find_device_by_name("Tag-B", shared=True)
+
+    assert sorted(name for _, name in discovery._SHARED_SEEN) == ["Tag-B", "Tag-B_EEFF"]
@@ -0,0 +1,229 @@
+"""Test image encoders and compression."""
+
+from __future__ import annotations
+
+import zlib
+
+import numpy as np
+import pytest
+from epaper_dithering import ColorScheme
+from PIL import Image, ImageOps
+
+from opendisplay.encoding.bitplanes import encode_bitplanes
+from opendisplay.encoding.compression import compress_image_data, decompress_image_data
+from opendisplay.encoding.images import encode_1bpp, encode_2bpp, encode_4bpp, encode_image, fit_image
+from opendisplay.models.enums import FitMode
+
+
+def _palette_image(pixels: np.ndarray) -> Image.Image:
+    return Image.fromarray(pixels.astype(np.uint8), mode="P")
+
+
+def _reference_plane(pixels: np.ndarray, palette_index: int) -> bytes:
+    """Pack one bitplane pixel by pixel, MSB first, rows padded to bytes."""
+    height, width = pixels.shape
+    bytes_per_row = (width + 7) // 8
+    output = bytearray(bytes_per_row * height)
+    for y in range(height):
+        for x in range(width):
+            if pixels[y, x] == palette_index:
+                output[y * bytes_per_row + x // 8] |= 1 << (7 - x % 8)
+    return bytes(output)
+
+
+class TestEncodeBitplanes:
+    """Test BWR/BWY bitplane encoding."""
+
+    @pytest.mark.parametrize("size", [(8, 1), (13, 7), (296, 128)])
+    def test_matches_reference_packing(self, size):
+        """White goes to plane 1, red/yellow to plane 2, rows padded to whole bytes."""
+        width, height = size
+        pixels = np.random.default_rng(0).integers(0, 3, (height, width))
+
+        plane1, plane2 = encode_bitplanes(_palette_image(pixels), ColorScheme.BWR)
+
+        assert plane1 == _reference_plane(pixels, 1)
+        assert plane2 == _reference_plane(pixels, 2)
+
+    def test_writes_into_shared_buffer(self):
+        """Both planes should land back-to-back in a caller-provided buffer."""
+        pixels = np.array([[0, 1, 2, 1, 0, 2, 2, 1, 1]])
+        out = bytearray(4)
+
+        plane1, plane2 = encode_bitplanes(_palette_image(pixels), ColorScheme.BWY, out=out)
+
+        assert bytes(out) == bytes([0b01010001, 0b10000000, 0b00100110, 0b00000000])
+        assert bytes(plane1) == bytes(out[:2])
+        assert bytes(plane2) == bytes(out[2:])
+
+    def test_rejects_wrong_buffer_size(self):
+        """A buffer that cannot hold both planes is an error."""
+        pixels = np.zeros((2, 8))
+
+        with pytest.raises(ValueError, match="must be 4 bytes"):
+            encode_bitplanes(_palette_image(pixels), ColorScheme.BWR, out=bytearray(3))
+
+
+def _reference_packed(pixels: np.ndarray, bits: int, mapping: dict[int, int] | None = None) -> bytes:
+    """Pack palette indices pixel by pixel, MSB first, rows padded to bytes."""
+    height, width = pixels.shape
+    per_byte = 8 // bits
+    bytes_per_row = (width + per_byte - 1) // per_byte
+    output = bytearray(bytes_per_row * height)
+    for y in range(height):
+        for x in range(width):
+            value = int(pixels[y, x]) & ((1 << bits) - 1)
+            if mapping is not None:
+                value = mapping.get(value, 0)
+            shift = (per_byte - 1 - x % per_byte) * bits
+            output[y * bytes_per_row + x // per_byte] |= value << shift
+    return bytes(output)
+
+
+class TestEncodePacked:
+    """Test 1/2/4 bits-per-pixel encoders."""
+
+    @pytest.mark.parametrize("size", [(1, 1), (7, 3), (13, 5), (296, 128)])
+    def test_encode_1bpp(self, size):
+        """Any non-zero index is white; rows are padded to 8 pixels."""
+        width, height = size
+        pixels = np.random.default_rng(1).integers(0, 2, (height, width))
+
+        assert encode_1bpp(_palette_image(pixels)) == _reference_packed(pixels, 1)
+
+    @pytest.mark.parametrize("size", [(1, 1), (13, 5), (296, 128)])
+    def test_encode_1bpp_bilevel_matches_palette(self, size):
+        """Mode '1' images encode exactly like the equivalent palette image."""
+        width, height = size
+        pixels = np.random.default_rng(6).integers(0, 2, (height, width))
+        bilevel = Image.fromarray((pixels * 255).astype(np.uint8), mode="L").convert("1", dither=Image.Dither.NONE)
+
+        assert encode_1bpp(bilevel) == _reference_packed(pixels, 1)
+
+    def test_encode_1bpp_any_nonzero_index_is_white(self):
+        """Indices above 1 still set their bit rather than being masked to bit 0."""
+        pixels = np.array([[0, 2, 0, 255, 3, 0, 0, 1, 4]])
+
+        assert encode_1bpp(_palette_image(pixels)) == bytes([0b01011001, 0b10000000])
+
+    @pytest.mark.parametrize("size", [(1, 1), (7, 3), (13, 5), (296, 128)])
+    def test_encode_2bpp(self, size):
+        """Rows are padded to 4 pixels."""
+        width, height = size
+        pixels = np.random.default_rng(2).integers(0, 4, (height, width))
+
+        assert encode_2bpp(_palette_image(pixels)) == _reference_packed(pixels, 2)
+
+    @pytest.mark.parametrize("size", [(1, 1), (7, 3), (296, 128)])
+    def test_encode_4bpp(self, size):
+        """Rows are padded to 2 pixels."""
+        width, height = size
+        pixels = np.random.default_rng(3).integers(0, 16, (height, width))
+
+        assert encode_4bpp(_palette_image(pixels)) == _reference_packed(pixels, 4)
+
+    def test_encode_4bpp_bwgbry_mapping(self):
+        """Spectra 6 indices skip firmware value 4; unknown indices become 0."""
+        pixels = np.array([[0, 1, 2, 3, 4, 5, 6, 15]])
+
+        assert encode_4bpp(_palette_image(pixels), bwgbry_mapping=True) == bytes([0x01, 0x23, 0x56, 0x00])
+
+    def test_encode_4bpp_bwgbry_mapping_all_indices(self):
+        """Every 4-bit index remaps like the firmware table, on odd widths too."""
+        pixels = np.random.default_rng(4).integers(0, 16, (5, 13))
+        mapping = {0: 0, 1: 1, 2: 2, 3: 3, 4: 5, 5: 6}
+
+        expected = _reference_packed(pixels, 4, mapping)
+
+        assert encode_4bpp(_palette_image(pixels), bwgbry_mapping=True) == expected
+
+
+class TestEncodeImage:
+    """Test color scheme dispatch."""
+
+    @pytest.mark.parametrize(
+        ("scheme", "expected"),
+        [
+            (ColorScheme.MONO, encode_1bpp),
+            (ColorScheme.BWRY, encode_2bpp),
+            (ColorScheme.GRAYSCALE_4, encode_2bpp),
+            (ColorScheme.BWGBRY, lambda img: encode_4bpp(img, bwgbry_mapping=True)),
+        ],
+    )
+    def test_dispatches_to_packed_encoder(self, scheme, expected):
+        """Each packed scheme uses its encoder, BWGBRY with the firmware remap."""
+        image = _palette_image(np.random.default_rng(7).integers(0, 6, (4, 11)))
+
+        assert encode_image(image, scheme) == expected(image)
+
+    @pytest.mark.parametrize("scheme", [ColorScheme.BWR, ColorScheme.BWY])
+    def test_bitplane_schemes_rejected(self, scheme):
+        """Three-color schemes must go through encode_bitplanes()."""
+        image = _palette_image(np.zeros((2, 8)))
+
+        with pytest.raises(ValueError, match="requires bitplane encoding"):
+            encode_image(image, scheme)
+
+
+class TestCompressImageData:
+    """Test image data compression."""
+
+    def test_round_trip_zlib_stream(self):
+        """Default output is a zlib stream with header."""
+        data = bytes(range(256)) * 40
+
+        compressed = compress_image_data(data)
+
+        assert compressed[:1] == b"\x78"
+        assert decompress_image_data(compressed) == data
+
+    def test_raw_deflate_drops_zlib_wrapper(self):
+        """Negative wbits produces raw deflate without header or checksum."""
+        data = bytes(range(256)) * 40
+
+        raw = compress_image_data(data, wbits=-15)
+
+        assert len(raw) == len(compress_image_data(data)) - 6
+        assert decompress_image_data(raw, wbits=-15) == data
+
+    def test_rle_strategy_round_trips(self):
+        """Z_RLE output is a standard zlib stream."""
+        data = bytes(range(256)) * 40
+
+        compressed = compress_image_data(data, strategy=zlib.Z_RLE)
+
+        assert compressed != compress_image_data(data)
+        assert decompress_image_data(compressed) == data
+
+
+class TestFitImage:
+    """Test image fitting to display dimensions."""
+
+    @pytest.mark.parametrize("fit", list(FitMode))
+    def test_large_downscale_hits_target_size(self, fit):
+        """Every mode yields exactly the display size, including pre-reduced paths."""
+        image = Image.new("RGB", (1200, 900), (10, 20, 30))
+
+        assert fit_image(image, (120, 60), fit).size == (120, 60)
+
+    def test_contain_prereduce_matches_full_lanczos(self):
+        """Box pre-reduction keeps CONTAIN output within one level of a direct LANCZOS pad."""
+        gradient = np.add.outer(np.linspace(0, 127, 600), np.linspace(0, 127, 900))
+        image = Image.fromarray(gradient.astype(np.uint8), mode="L").convert("RGB")
+
+        reference = ImageOps.pad(image, (90, 40), Image.Resampling.LANCZOS, color=(255, 255, 255))
+        fitted = fit_image(image, (90, 40), FitMode.CONTAIN)
+
+        assert np.abs(np.asarray(fitted, dtype=int) - np.asarray(reference, dtype=int)).max() <= 1
+
+    @pytest.mark.parametrize("mode", ["RGB", "L"])
+    def test_crop_pads_centered_region(self, mode):
+        """CROP keeps the centered source region and pads the rest with white."""
+        pixels = np.random.default_rng(5).integers(0, 256, (30, 120), dtype=np.uint8)
+        image = Image.fromarray(pixels, mode="L").convert(mode)
+
+        fitted = fit_image(image, (80, 50), FitMode.CROP)
+
+        expected = Image.new("RGB", (80, 50), (255, 255, 255))
+        expected.paste(image.crop((20, 0, 100, 30)), (0, 10))
+        assert fitted.tobytes() == expected.tobytes()
@@ -1,5 +1,7 @@
 """Test BLE advertisement data parsing."""
 
+from dataclasses import fields
+
 import pytest
 
 from opendisplay.models.advertisement import (
@@ -8,6 +10,7 @@ from opendisplay.models.advertisement import (
     decode_button_event,
     parse_advertisement,
 )
+from opendisplay.models.enums import AdvertisementFormat, ButtonEventType
 
 
 def _v1_payload(
@@ -133,6 +136,46 @@ class TestParseAdvertisement:
         assert result.connection_requested is False
         assert result.dynamic_data == bytes([1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11])
 
+    def test_parse_advertisement_format_is_enum(self):
+        """format_version should be an enum member that still equals its string value."""
+        data = bytes([1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 0x7C, 0x8B, 0x53])
+
+        result = parse_advertisement(data)
+
+        assert result.format_version is AdvertisementFormat.V1
+        assert f"{result.format_version}" == "v1"
+
+    def test_dynamic_hex_matches_dynamic_data(self):
+        """dynamic_hex should be the hex string of dynamic_data."""
+        data = bytes([1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 0x7C, 0x8B, 0x53])
+
+        result = parse_advertisement(data)
+
+        assert result.dynamic_hex == "0102030405060708090a0b"
+        assert not [f.name for f in fields(result) if f.name.startswith("_")]
+
+    def test_advertisement_data_uses_slots(self):
+        """Per-packet dataclasses should not carry an instance __dict__."""
+        data = bytes([1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 0x7C, 0x8B, 0x53])
+
+        result = parse_advertisement(data)
+
+        assert not hasattr(result, "__dict__")
+        assert not hasattr(decode_button_event(0x21, byte_index=0), "__dict__")
+
+    def test_parse_advertisement_shared_returns_independent_instances(self):
+        """shared=True should cache decoded values, not a mutable instance."""
+        data = bytes([1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 0x7C, 0x8B, 0x53])
+
+        first = parse_advertisement(data, shared=True)
+        first.battery_mv = 0
+
+        second = parse_advertisement(bytearray(data), shared=True)
+
+        assert second is not first
+        assert second == parse_advertisement(data)
+        assert second.battery_mv == 3950
+
     def test_parse_advertisement_strips_manufacturer_id_for_legacy(self):
         """Parser should accept payloads with manufacturer ID included."""
         # Manufacturer ID 0x2446 (little-endian), followed by legacy 11-byte payload
@@ -221,5 +264,8 @@ class TestParseAdvertisement:
 
         third_events = tracker.update(address, third, timestamp=3.0)
         assert [e.event_type for e in third_events] == ["button_up"]
+        assert third_events[0].event_type is ButtonEventType.BUTTON_UP
+
+        assert tracker.update(address, third, timestamp=4.0) == []
         assert third_events[0].button_id == 2
         assert third_events[0].pressed is False
@@ -121,6 +121,13 @@ class TestCommandBuilders:
         cmd = build_direct_write_data_command(chunk)
         assert len(cmd) == CHUNK_SIZE + 2
 
+    def test_build_direct_write_data_command_accepts_memoryview(self):
+        """Test DATA command accepts a zero-copy memoryview slice."""
+        data = bytes(range(200))
+        cmd = build_direct_write_data_command(memoryview(data)[50:150])
+        assert isinstance(cmd, bytes)
+        assert cmd == b"\x00\x71" + data[50:150]
+
     def test_build_direct_write_data_command_too_large(self):
         """Test DATA command rejects oversized chunks."""
         chunk = b"A" * (CHUNK_SIZE + 1)
@@ -0,0 +1,15 @@
+"""Test config serializer helpers."""
+
+from opendisplay.protocol import calculate_config_crc
+
+
+class TestCalculateConfigCrc:
+    """Test the truncated CRC32 used in WRITE_CONFIG payloads."""
+
+    def test_standard_check_value(self):
+        """Lower 16 bits of CRC32("123456789") = 0xCBF43926."""
+        assert calculate_config_crc(b"123456789") == 0x3926
+
+    def test_empty_data(self):
+        """CRC32 of no data is 0."""
+        assert calculate_config_crc(b"") == 0
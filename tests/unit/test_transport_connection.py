@@ -0,0 +1,28 @@
+"""Test BLEConnection response queue handling."""
+
+from __future__ import annotations
+
+import pytest
+
+from opendisplay.exceptions import BLETimeoutError
+from opendisplay.transport import BLEConnection
+
+
+@pytest.mark.asyncio
+async def test_read_response_returns_queued_notification() -> None:
+    """Notifications already queued are returned in arrival order."""
+    connection = BLEConnection("AA:BB:CC:DD:EE:FF")
+    connection._notification_callback(None, bytearray(b"\x00\x71"))  # type: ignore[arg-type]
+    connection._notification_callback(None, bytearray(b"\x00\x72"))  # type: ignore[arg-type]
+
+    assert await connection.read_response(timeout=0.01) == b"\x00\x71"
+    assert await connection.read_response(timeout=0.01) == b"\x00\x72"
+
+
+@pytest.mark.asyncio
+async def test_read_response_times_out_when_empty() -> None:
+    """An empty queue still honours the timeout."""
+    connection = BLEConnection("AA:BB:CC:DD:EE:FF")
+
+    with pytest.raises(BLETimeoutError, match="No response received"):
+        await connection.read_response(timeout=0.01)